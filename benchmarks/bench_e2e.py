@@ -0,0 +1,148 @@
+"""
+End-to-end benchmarks of the hot paths against local stand-in servers.
+
+Starts a fake Ollama daemon and a fake ollama.com / Hugging Face catalog
+(`ollama_manager.testing`) serving `fixtures/`, then times:
+
+- api.list_tags (list_remote_model_tags): fetch + parse a library tags page
+- pull_model_async: search, tag listing and a streamed pull, menus auto-selected
+- olm list (list_ollama_models): daemon listing + table rendering
+- chat streaming: the `ollama.chat(stream=True)` loop used by the Streamlit UIs
+
+>> python benchmarks/bench_e2e.py --latency 0.02 --bandwidth 5e6
+"""
+
+import argparse
+import asyncio
+import contextlib
+import io
+import os
+import socket
+import statistics
+import time
+from pathlib import Path
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def measure(func, runs: int) -> list[float]:
+    """Runs `func` `runs` times after one warm-up, returns timings in ms."""
+    func()
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        func()
+        timings.append((time.perf_counter() - start) * 1000)
+    return timings
+
+
+def report(name: str, timings: list[float], extra: str = ""):
+    timings = sorted(timings)
+    p95 = timings[min(len(timings) - 1, int(len(timings) * 0.95))]
+    print(
+        f"{name:<28}{len(timings):>6}{statistics.median(timings):>10.1f}"
+        f"{p95:>10.1f}{statistics.fmean(timings):>10.1f}  {extra}"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="End-to-end benchmarks")
+    parser.add_argument("--runs", type=int, default=20)
+    parser.add_argument("--models", type=int, default=500, help="Local models")
+    parser.add_argument("--latency", type=float, default=0.0, help="Seconds")
+    parser.add_argument("--bandwidth", type=float, default=None, help="Bytes/s")
+    parser.add_argument("--token-delay", type=float, default=0.0, help="Seconds")
+    args = parser.parse_args()
+
+    # `ollama` and `ollama_manager` read these at import time, so every import
+    # of either comes after the environment points at the stand-ins
+    ollama_port, remote_port = free_port(), free_port()
+    os.environ["OLLAMA_HOST"] = f"127.0.0.1:{ollama_port}"
+    os.environ["OLM_OLLAMA_URL"] = f"http://127.0.0.1:{remote_port}"
+    os.environ["OLM_HUGGING_FACE_URL"] = f"http://127.0.0.1:{remote_port}"
+
+    import ollama
+    from click.testing import CliRunner
+
+    from ollama_manager import api
+    from ollama_manager.app import cli
+    from ollama_manager.commands import pull
+    from ollama_manager.testing import FakeOllamaServer, FakeRemoteServer
+    from ollama_manager.utils.clients import get_http_client
+
+    shaping = {"latency": args.latency, "bandwidth": args.bandwidth}
+    with (
+        FakeOllamaServer(
+            models=args.models,
+            token_delay=args.token_delay,
+            port=ollama_port,
+            **shaping,
+        ) as daemon,
+        FakeRemoteServer(FIXTURES_DIR, port=remote_port, **shaping),
+    ):
+        print(
+            f"{'benchmark':<28}{'runs':>6}{'p50 ms':>10}{'p95 ms':>10}{'mean ms':>10}"
+        )
+
+        async def list_tags():
+            async with get_http_client() as client:
+                return await api.list_tags("qwen3", client=client)
+
+        report(
+            "list_remote_model_tags",
+            measure(lambda: asyncio.run(list_tags()), args.runs),
+            f"{len(asyncio.run(list_tags()))} tags",
+        )
+
+        # Auto-select the first menu entry so the interactive flow can be timed
+        pull.handle_interaction = lambda data, **kwargs: [data[0]]
+
+        def pull_model():
+            with contextlib.redirect_stdout(io.StringIO()):
+                asyncio.run(pull.pull_model_async(False, None, 20, False))
+
+        report("pull_model_async", measure(pull_model, args.runs))
+
+        runner = CliRunner()
+
+        def list_models():
+            result = runner.invoke(cli, ["list"])
+            assert result.exit_code == 0, result.output
+
+        report(
+            "list_ollama_models",
+            measure(list_models, args.runs),
+            f"{len(daemon.models)} models",
+        )
+
+        model = next(iter(daemon.models))
+        first_token = []
+
+        def chat():
+            start = time.perf_counter()
+            stream = ollama.chat(
+                model=model,
+                stream=True,
+                messages=[{"role": "user", "content": "Hello"}],
+            )
+            for index, chunk in enumerate(stream):
+                if index == 0:
+                    first_token.append((time.perf_counter() - start) * 1000)
+                if chunk["done"]:
+                    break
+
+        report(
+            "chat_stream",
+            measure(chat, args.runs),
+            f"TTFT p50 {statistics.median(first_token):.1f} ms",
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+"""
+Micro-benchmark for Hugging Face quantization parsing.
+
+Compares the previous per-call regex build against the precompiled parser over
+the sibling listings in `fixtures/hugging_face`.
+
+>> python benchmarks/bench_quantization.py
+"""
+
+import json
+import re
+import timeit
+from pathlib import Path
+
+from ollama_manager.api import (
+    _canonical_quantization,
+    extract_quantization,
+    group_quantizations,
+)
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures" / "hugging_face"
+REPEAT = 5
+NUMBER = 200
+
+
+def legacy_extract_quantization(text):
+    patterns = [
+        r"IQ\d+[_-]?[KM]?",
+        r"Q\d+[_-]?[KM]?",
+        r"F16",
+        r"F32",
+        r"E5",
+        r"GPTQ",
+        r"AWQ",
+        r"[KQ]\d+_\d+",
+    ]
+
+    combined_pattern = "|".join(f"({p})" for p in patterns)
+
+    match = re.search(combined_pattern, text, re.IGNORECASE)
+    if match:
+        for group in match.groups():
+            if group:
+                return group
+
+    return None
+
+
+def legacy_list_quantizations(files):
+    payload = []
+    for file in files:
+        filename = file.get("rfilename")
+        if filename.endswith(".gguf"):
+            quantization = legacy_extract_quantization(filename)
+            if not quantization:
+                continue
+            payload.append((quantization, file.get("size")))
+    return payload
+
+
+def best_of(func) -> float:
+    """Best per-call time in microseconds."""
+    return min(timeit.repeat(func, repeat=REPEAT, number=NUMBER)) / NUMBER * 1e6
+
+
+def cold(func):
+    """Runs `func` with the parsed-basename cache emptied first."""
+
+    def wrapper():
+        _canonical_quantization.cache_clear()
+        return func()
+
+    return wrapper
+
+
+def main():
+    print(
+        f"{'repo':<42}{'files':>7}{'quants':>8}"
+        f"{'legacy µs':>12}{'cold µs':>10}{'warm µs':>10}"
+    )
+    for fixture in sorted(FIXTURES_DIR.glob("*.json")):
+        siblings = json.loads(fixture.read_text())["siblings"]
+        legacy = best_of(lambda: legacy_list_quantizations(siblings))
+        uncached = best_of(cold(lambda: group_quantizations(siblings)))
+        cached = best_of(lambda: group_quantizations(siblings))
+        print(
+            f"{fixture.stem:<42}{len(siblings):>7}{len(group_quantizations(siblings)):>8}"
+            f"{legacy:>12.1f}{uncached:>10.1f}{cached:>10.1f}"
+        )
+
+    filenames = [
+        file["rfilename"]
+        for fixture in FIXTURES_DIR.glob("*.json")
+        for file in json.loads(fixture.read_text())["siblings"]
+    ]
+    legacy = best_of(lambda: [legacy_extract_quantization(f) for f in filenames])
+    current = best_of(cold(lambda: [extract_quantization(f) for f in filenames]))
+    print(
+        f"\nextract_quantization over {len(filenames)} filenames (cold): "
+        f"legacy {legacy:.1f} µs, new {current:.1f} µs ({legacy / current:.1f}x)"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,557 @@
+"""
+Embeddable async API for managing Ollama models.
+
+Every function raises `ollama_manager.exceptions.OllamaManagerError` subclasses
+instead of printing or exiting, so it can be used from other asyncio code:
+
+    import asyncio
+    from ollama_manager import api
+
+    models = asyncio.run(api.list_models(sort="size", order="desc"))
+
+Remote functions accept an optional `httpx.AsyncClient` and local ones an
+optional `ollama.AsyncClient`, letting callers share connection pools across
+batched calls.
+"""
+
+import asyncio
+import contextlib
+import functools
+import inspect
+import re
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Callable
+
+import httpx
+import ollama
+from bs4 import BeautifulSoup, SoupStrainer
+
+from ollama_manager.exceptions import (
+    OllamaConnectionError,
+    OllamaManagerError,
+    RequestError,
+)
+from ollama_manager.inventory import LocalModel, SortKey, SortOrder, inventory
+from ollama_manager.registry import ManifestCache, fetch_manifest_digest
+from ollama_manager.utils import (
+    format_bytes,
+    humanized_relative_time,
+    with_default_tag,
+)
+from ollama_manager.utils.clients import (
+    HUGGING_FACE_URL,
+    OLLAMA_URL,
+    get_http_client,
+    get_ollama_client,
+    make_request,
+)
+from ollama_manager.utils.profiling import span
+
+HUGGING_FACE_ERROR = "Failed fetching model from Hugging Face.\n>>> 🔁 Try again\n>>> 🛜 Make sure you are connected to the internet."
+
+
+@dataclass(slots=True)
+class ModelTag:
+    """A pullable tag of an Ollama library model or Hugging Face quantization."""
+
+    title: str
+    size: str | None = None
+    context_window: str | None = None
+    input_types: list[str] = field(default_factory=list)
+    updated: str | None = None
+    hash: str | None = None
+
+
+@dataclass(slots=True, frozen=True)
+class PullProgress:
+    """A progress update streamed while pulling a model."""
+
+    model: str
+    status: str | None
+    completed: int | None = None
+    total: int | None = None
+
+
+@dataclass(slots=True, frozen=True)
+class ModelUpdate:
+    """The result of comparing a local model with its registry manifest."""
+
+    name: str
+    local_digest: str
+    remote_digest: str | None = None
+    error: str | None = None
+
+    @property
+    def outdated(self) -> bool:
+        return (
+            self.remote_digest is not None and self.remote_digest != self.local_digest
+        )
+
+
+ProgressCallback = Callable[[PullProgress], Any]
+
+
+@contextlib.asynccontextmanager
+async def _remote_client(
+    client: httpx.AsyncClient | None,
+) -> AsyncIterator[httpx.AsyncClient]:
+    """Yields `client`, or a short-lived pooled client when none is given."""
+    if client is not None:
+        yield client
+        return
+
+    async with get_http_client() as owned_client:
+        yield owned_client
+
+
+# Matched against the basename only, so directory names never shadow the
+# file's own quantization tag.
+_QUANTIZATION_PATTERN = re.compile(
+    r"(?<![a-z0-9])"
+    r"(?P<prefix>UD-)?"
+    r"(?P<quant>"
+    r"I?Q\d+(?:[_-]?[KM])?(?:_[A-Z0-9]{1,3}){0,3}"  # Q4_K_M, IQ4_XS, Q8_0, Q4K
+    r"|BF16|F16|F32"  # Unquantized precisions
+    r"|E5|GPTQ|AWQ"
+    r"|K\d+_\d+"  # K4_0
+    r")"
+    r"(?![a-z0-9])",
+    re.IGNORECASE,
+)
+_SHARD_PATTERN = re.compile(r"-\d{5}-of-\d{5}(?=\.gguf$)", re.IGNORECASE)
+
+
+def extract_quantization(text: str) -> str | None:
+    """
+    Extracts the canonical quantization tag from a model filename.
+
+    Args:
+        text: The model filename string.
+
+    Returns:
+        The upper-cased quantization string (e.g., "Q4_K_M", "IQ4_XS", "F16",
+        "UD-Q2_K_XL") or None if not found.
+    """
+    return _canonical_quantization(text.rpartition("/")[2])
+
+
+@functools.lru_cache(maxsize=1024)
+def _canonical_quantization(basename: str) -> str | None:
+    match = _QUANTIZATION_PATTERN.search(basename)
+    if not match:
+        return None
+
+    quantization = match.group("quant").upper().replace("-", "_")
+    if match.group("prefix"):
+        return f"UD-{quantization}"
+    return quantization
+
+
+def group_quantizations(files: list[dict]) -> dict[str, int]:
+    """
+    Groups GGUF sibling files of a Hugging Face repo by quantization.
+
+    Split shards (``-00001-of-00003.gguf``) are folded into a single entry with
+    their sizes summed. When several files resolve to the same quantization only
+    the first one is kept, and multimodal projector files (``mmproj-*``) are
+    skipped since Ollama pulls them alongside the model.
+
+    Args:
+        files: The ``siblings`` list returned by the Hugging Face models API.
+
+    Returns:
+        Mapping of quantization to total size in bytes, in listing order.
+    """
+    # quantization -> {shard-less file path: summed size}
+    variants: dict[str, dict[tuple[str, str], int]] = {}
+    for file in files:
+        filename = file.get("rfilename", "")
+        if not filename.endswith(".gguf"):
+            continue
+
+        directory, _, basename = filename.rpartition("/")
+        if basename[:6].lower() == "mmproj":
+            continue
+
+        # All shards of a split file share one stem, so the quantization is
+        # parsed once per variant rather than once per shard.
+        if "-of-" in basename:
+            basename = _SHARD_PATTERN.sub("", basename)
+
+        quantization = _canonical_quantization(basename)
+        if not quantization:
+            continue
+
+        stem = (directory, basename)
+        sizes = variants.setdefault(quantization, {})
+        sizes[stem] = sizes.get(stem, 0) + (file.get("size") or 0)
+
+    return {
+        quantization: next(iter(sizes.values()))
+        for quantization, sizes in variants.items()
+    }
+
+
+def parse_model_tags(html: str) -> list[ModelTag]:
+    """
+    Parses the tags page of an Ollama library model.
+    """
+    soup = BeautifulSoup(html, "html.parser")
+
+    model_entries = soup.select("div.group")
+    if not model_entries:
+        return []
+
+    tags = []
+    for entry in model_entries:
+        # Extract model name and tag
+        name_element = entry.select_one("span.group-hover\\:underline")
+        if not name_element:
+            continue
+
+        full_name = name_element.text.strip()
+        tag_parts = full_name.split(":")
+        tag_name = tag_parts[1] if len(tag_parts) > 1 else "latest"
+
+        size_element = entry.select_one("p.col-span-2") or entry.select_one(
+            "div.text-neutral-500"
+        )
+        size = None
+        if size_element:
+            size_text = size_element.get_text(strip=True)
+            size_match = re.search(r"(\d+(?:\.\d+)?[GMKT]B)", size_text)
+            if size_match:
+                size = size_match.group(1)
+
+        context_element = (
+            entry.select("p.col-span-2")[1]
+            if len(entry.select("p.col-span-2")) > 1
+            else None
+        )
+        context_window = None
+        if context_element:
+            context_window = context_element.get_text(strip=True)
+        else:
+            all_text = entry.get_text(separator=" ", strip=True)
+            context_match = re.search(r"(\d+[KM]?) context window", all_text)
+            if context_match:
+                context_window = context_match.group(1)
+
+        input_element = entry.select_one("div.col-span-2") or entry.select_one(
+            "div.text-neutral-500"
+        )
+        input_types = []
+        if input_element:
+            input_text = input_element.get_text(strip=True)
+            if "Text" in input_text:
+                input_types.append("Text")
+            if "Vision" in input_text:
+                input_types.append("Vision")
+
+        timestamp_element = entry.select_one(
+            "div.flex.text-neutral-500.text-xs"
+        ) or entry.select_one("div.flex.sm\\:hidden")
+        updated = None
+        if timestamp_element:
+            timestamp_text = timestamp_element.get_text(strip=True)
+            time_match = re.search(r"(\d+\s+\w+\s+ago)", timestamp_text)
+            if time_match:
+                updated = time_match.group(1)
+
+        hash_element = entry.select_one("span.font-mono")
+        hash_id = hash_element.get_text(strip=True) if hash_element else None
+
+        tags.append(
+            ModelTag(
+                title=tag_name,
+                size=size,
+                context_window=context_window,
+                input_types=input_types,
+                updated=updated,
+                hash=hash_id,
+            )
+        )
+
+    return tags
+
+
+async def list_models(
+    sort: SortKey = "name",
+    order: SortOrder = "asc",
+    filter: str | None = None,
+    limit: int | None = None,
+    offset: int = 0,
+    client: ollama.AsyncClient | None = None,
+    max_age: float | None = None,
+) -> list[LocalModel]:
+    """
+    Lists the models available on the local Ollama daemon.
+
+    Served from the shared inventory snapshot, see `ollama_manager.inventory`.
+
+    Args:
+        sort: Sort by model `name`, modified `date` or `size`.
+        order: `asc` or `desc`.
+        filter: Case-insensitive substring, or glob when it contains `*?[`.
+        limit: Maximum number of models to return.
+        offset: Number of matching models to skip.
+        client: Ollama client to use, defaults to a pooled local client.
+        max_age: Seconds a cached snapshot may be served without asking the
+            daemon again, defaults to `OLM_INVENTORY_MAX_AGE` (0).
+    """
+    models, _ = await inventory.query(
+        sort=sort,
+        order=order,
+        filter=filter,
+        limit=limit,
+        offset=offset,
+        client=client,
+        max_age=max_age,
+    )
+    return models
+
+
+async def search_models(client: httpx.AsyncClient | None = None) -> list[str]:
+    """
+    Lists the models published on the Ollama library (https://ollama.com/search).
+    """
+    async with _remote_client(client) as client:
+        response = await make_request(client, f"{OLLAMA_URL}/search")
+
+    with span("html.parse"):
+        title_strainer = SoupStrainer(
+            "span", attrs={"x-test-search-response-title": True}
+        )
+        soup = BeautifulSoup(response.text, "html.parser", parse_only=title_strainer)
+        elements = soup.find_all("span", attrs={"x-test-search-response-title": True})
+
+        return [element.text.strip() for element in elements]
+
+
+async def list_tags(
+    model_name: str, client: httpx.AsyncClient | None = None
+) -> list[ModelTag]:
+    """
+    Lists the tags of an Ollama library model.
+    """
+    async with _remote_client(client) as client:
+        response = await make_request(client, f"{OLLAMA_URL}/library/{model_name}/tags")
+
+    with span("html.parse"):
+        return parse_model_tags(response.text)
+
+
+async def search_hugging_face(
+    query: str,
+    limit: int = 20,
+    multimodal: bool = False,
+    client: httpx.AsyncClient | None = None,
+) -> list[str]:
+    """
+    Searches GGUF models on Hugging Face, most downloaded first.
+
+    Raises:
+        OllamaManagerError: When no model matches `query`.
+    """
+    params = {
+        "pipeline_tag": "image-text-to-text" if multimodal else "text-generation",
+        "filter": "gguf",
+        "sort": "downloads",
+        "direction": "-1",
+        "limit": limit,
+        "full": False,
+        "config": False,
+        "search": query,
+    }
+    async with _remote_client(client) as client:
+        try:
+            res = await make_request(
+                client, f"{HUGGING_FACE_URL}/api/models", params=params
+            )
+        except RequestError as e:
+            raise RequestError(HUGGING_FACE_ERROR, e.status_code) from e
+    hf_response = res.json()
+
+    if not hf_response:
+        raise OllamaManagerError(f"Model not found: {query}")
+
+    return [response.get("modelId") for response in hf_response]
+
+
+async def list_quantizations(
+    model_name: str, client: httpx.AsyncClient | None = None
+) -> list[ModelTag]:
+    """
+    Lists the GGUF quantizations available in a Hugging Face repo.
+    """
+    async with _remote_client(client) as client:
+        try:
+            res = await make_request(
+                client,
+                f"{HUGGING_FACE_URL}/api/models/{model_name}",
+                params={"blobs": "true"},
+            )
+        except RequestError as e:
+            raise RequestError(HUGGING_FACE_ERROR, e.status_code) from e
+    hf_response = res.json()
+    files = hf_response.get("siblings") or []
+    last_modified = humanized_relative_time(hf_response.get("lastModified"))
+
+    with span("quantization.group", files=len(files)):
+        return [
+            ModelTag(title=quantization, size=format_bytes(size), updated=last_modified)
+            for quantization, size in group_quantizations(files).items()
+        ]
+
+
+async def pull(
+    model: str,
+    progress: ProgressCallback | None = None,
+    client: ollama.AsyncClient | None = None,
+) -> None:
+    """
+    Pulls `model` into the local Ollama daemon.
+
+    Args:
+        model: Model name with tag, e.g. `llama3.2:1b` or `hf.co/{repo}:{quant}`.
+        progress: Called with every `PullProgress` update, may be a coroutine
+            function.
+        client: Ollama client to use, defaults to a pooled local client.
+    """
+    client = client or get_ollama_client()
+    with span("ollama.pull", model=model):
+        try:
+            async for data in await client.pull(model, stream=True):
+                if progress is None:
+                    continue
+
+                result = progress(
+                    PullProgress(
+                        model=model,
+                        status=data.status,
+                        completed=data.completed,
+                        total=data.total,
+                    )
+                )
+                if inspect.isawaitable(result):
+                    await result
+        except (ConnectionError, httpx.HTTPError, ollama.ResponseError) as e:
+            raise OllamaConnectionError(f"Failed downloading {model}\n{e}") from e
+        finally:
+            inventory.invalidate()
+
+
+async def delete(model: str, client: ollama.AsyncClient | None = None) -> None:
+    """
+    Deletes `model` from the local Ollama daemon.
+    """
+    client = client or get_ollama_client()
+    with span("ollama.delete", model=model):
+        try:
+            await client.delete(model)
+        except (ConnectionError, httpx.HTTPError, ollama.ResponseError) as e:
+            raise OllamaConnectionError(f"Failed deleting {model}\n{e}") from e
+        finally:
+            inventory.invalidate()
+
+
+async def delete_many(
+    models: list[str],
+    client: ollama.AsyncClient | None = None,
+    on_deleted: Callable[[str], Any] | None = None,
+) -> None:
+    """
+    Deletes several models concurrently over a shared client.
+
+    Args:
+        on_deleted: Called with each model name as soon as it is deleted.
+    """
+    client = client or get_ollama_client()
+
+    async def delete_one(model: str):
+        await delete(model, client)
+        if on_deleted:
+            on_deleted(model)
+
+    await asyncio.gather(*(delete_one(model) for model in models))
+
+
+async def pull_many(
+    models: list[str],
+    concurrency: int = 2,
+    progress: ProgressCallback | None = None,
+    client: ollama.AsyncClient | None = None,
+) -> dict[str, OllamaManagerError]:
+    """
+    Pulls several models in parallel, at most `concurrency` at a time.
+
+    Returns:
+        Errors keyed by model name for the pulls that failed.
+    """
+    client = client or get_ollama_client()
+    semaphore = asyncio.Semaphore(concurrency)
+    errors = {}
+
+    async def pull_one(model: str):
+        async with semaphore:
+            try:
+                await pull(model, progress=progress, client=client)
+            except OllamaManagerError as e:
+                errors[model] = e
+
+    await asyncio.gather(*(pull_one(model) for model in models))
+    return errors
+
+
+async def check_updates(
+    models: list[str] | None = None,
+    concurrency: int = 8,
+    client: httpx.AsyncClient | None = None,
+    ollama_client: ollama.AsyncClient | None = None,
+    cache: ManifestCache | None = None,
+) -> list[ModelUpdate]:
+    """
+    Compares local model digests with their remote registry manifests.
+
+    Manifests are fetched concurrently, at most `concurrency` at a time, using
+    conditional requests against the on-disk ETag cache.
+
+    Args:
+        models: Names of local models to check, defaults to all of them.
+            Untagged names refer to the `latest` tag.
+        concurrency: Maximum number of in-flight manifest requests.
+        client: HTTP client for the registries.
+        ollama_client: Ollama client used to list local models.
+        cache: Manifest ETag cache, defaults to the user cache directory.
+
+    Raises:
+        OllamaManagerError: When any of `models` is not installed.
+    """
+    local_models = await list_models(client=ollama_client)
+    if models is not None:
+        wanted = {with_default_tag(model) for model in models}
+        missing = wanted - {model.name for model in local_models}
+        if missing:
+            raise OllamaManagerError(
+                f"Model not installed: {', '.join(sorted(missing))}"
+            )
+        local_models = [model for model in local_models if model.name in wanted]
+
+    cache = cache or ManifestCache()
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def check(model: LocalModel, client: httpx.AsyncClient) -> ModelUpdate:
+        async with semaphore:
+            try:
+                remote_digest = await fetch_manifest_digest(client, model.name, cache)
+            except RequestError as e:
+                return ModelUpdate(model.name, model.digest, error=str(e))
+        return ModelUpdate(model.name, model.digest, remote_digest)
+
+    async with _remote_client(client) as client:
+        updates = await asyncio.gather(
+            *(check(model, client) for model in local_models)
+        )
+
+    cache.save()
+    return list(updates)
@@ -6,14 +6,42 @@ from ollama_manager.commands.delete import delete_model
 from ollama_manager.commands.pull import pull_model
 from ollama_manager.commands.run import run_model
 from ollama_manager.commands.list import list_ollama_models
+from ollama_manager.commands.outdated import outdated_models, upgrade_models
+from ollama_manager.commands.batch import batch_run
+from ollama_manager.commands.embed import embed_corpus
+from ollama_manager.commands.queue import queue_group
+from ollama_manager.utils import profiling
 
 
 @click.group()
-def cli():
-    pass
+@click.option(
+    "--profile",
+    help="Print a timing breakdown of the command phases",
+    is_flag=True,
+    default=False,
+)
+@click.pass_context
+def cli(ctx: click.Context, profile: bool):
+    if not (profile or profiling.profiling_requested()):
+        return
+
+    profiling.enable_profiling()
+
+    def finish():
+        if profile:
+            profiling.print_report()
+        profiling.export_spans()
+
+    ctx.call_on_close(finish)
+    ctx.with_resource(profiling.span(f"olm {ctx.invoked_subcommand}"))
 
 
 cli.add_command(pull_model)
 cli.add_command(delete_model)
 cli.add_command(run_model)
 cli.add_command(list_ollama_models)
+cli.add_command(outdated_models)
+cli.add_command(upgrade_models)
+cli.add_command(batch_run)
+cli.add_command(embed_corpus)
+cli.add_command(queue_group)
@@ -0,0 +1,293 @@
+import asyncio
+import json
+import sys
+import time
+from pathlib import Path
+from typing import BinaryIO, Iterator
+
+import click
+import httpx
+import ollama
+from rich.console import Console
+
+from ollama_manager.exceptions import OllamaManagerError
+from ollama_manager.utils import handle_errors, handle_interaction, list_models
+from ollama_manager.utils.clients import get_ollama_client
+from ollama_manager.utils.concurrency import bounded_map
+from ollama_manager.utils.profiling import span
+
+
+def checkpoint_rows(file: BinaryIO) -> Iterator[tuple[bytes, dict]]:
+    """
+    Yields `(line, result)` for the complete result rows at the start of `file`,
+    stopping at the first partial or unreadable line.
+    """
+    for line in file:
+        if not line.endswith(b"\n"):
+            return
+        try:
+            result = json.loads(line)
+            result["index"]
+        except (ValueError, KeyError, TypeError):
+            return
+        yield line, result
+
+
+def read_checkpoint(output: Path) -> set[int]:
+    """
+    Collects the input indices successfully written to `output`.
+
+    Rows with an `error` are dropped from the file so resuming retries them,
+    and a trailing partial line left by an interrupted run is truncated away.
+    """
+    if not output.exists():
+        return set()
+
+    done = set()
+    failed = False
+    valid_bytes = 0
+    with output.open("rb") as file:
+        for line, result in checkpoint_rows(file):
+            if "error" in result:
+                failed = True
+            else:
+                done.add(result["index"])
+            valid_bytes += len(line)
+
+    if failed:
+        # Written aside and swapped in so an interruption never loses rows
+        rewritten = output.with_name(f"{output.name}.tmp")
+        with output.open("rb") as file, rewritten.open("wb") as out:
+            for line, result in checkpoint_rows(file):
+                if "error" not in result:
+                    out.write(line)
+        rewritten.replace(output)
+    elif valid_bytes != output.stat().st_size:
+        with output.open("r+b") as file:
+            file.truncate(valid_bytes)
+
+    return done
+
+
+# Expected JSON types of the request fields passed on to Ollama
+REQUEST_FIELDS = {
+    "prompt": (str, "a string"),
+    "system": (str, "a string"),
+    "options": (dict, "an object"),
+    "messages": (list, "a list"),
+}
+
+
+def parse_request(line: str) -> dict:
+    """
+    Parses a JSONL line, either an object with a `prompt` or `messages` key,
+    or a bare JSON string used as the prompt.
+
+    Raises:
+        ValueError: When the line is not valid JSON, an object or a string, or
+            a field has the wrong type.
+    """
+    request = json.loads(line)
+    if isinstance(request, str):
+        return {"prompt": request}
+    if not isinstance(request, dict):
+        raise ValueError(
+            f"expected an object or a string, got {type(request).__name__}"
+        )
+
+    for key, (expected, description) in REQUEST_FIELDS.items():
+        value = request.get(key)
+        if value is not None and not isinstance(value, expected):
+            raise ValueError(
+                f"'{key}' must be {description}, got {type(value).__name__}"
+            )
+    for message in request.get("messages") or []:
+        if not isinstance(message, dict) or not isinstance(message.get("role"), str):
+            raise ValueError("each message must be an object with a 'role'")
+
+    return request
+
+
+def read_requests(input_file: Path, skip: set[int]) -> Iterator[tuple[int, str]]:
+    """
+    Lazily yields `(index, line)` for each non-empty JSONL line not in `skip`.
+    """
+    with input_file.open() as file:
+        for index, line in enumerate(file):
+            if index in skip or not line.strip():
+                continue
+            yield index, line
+
+
+async def run_request(
+    client: ollama.AsyncClient, model: str, index: int, line: str
+) -> dict:
+    result = {"index": index}
+    try:
+        request = parse_request(line)
+    except ValueError as e:
+        result["error"] = f"Invalid request on line {index + 1}: {e}"
+        return result
+
+    if "id" in request:
+        result["id"] = request["id"]
+
+    try:
+        if "messages" in request:
+            response = await client.chat(
+                model=model,
+                messages=request["messages"],
+                options=request.get("options"),
+            )
+            result["response"] = response.message.content
+        else:
+            response = await client.generate(
+                model=model,
+                prompt=request.get("prompt", ""),
+                system=request.get("system"),
+                options=request.get("options"),
+            )
+            result["response"] = response.response
+        result["eval_count"] = response.eval_count
+        result["total_duration"] = response.total_duration
+    except (ollama.ResponseError, httpx.HTTPError) as e:
+        result["error"] = str(e)
+    except (TypeError, ValueError) as e:
+        # Anything else the client rejects, such as a malformed message
+        result["error"] = f"Invalid request on line {index + 1}: {e}"
+    except ConnectionError as e:
+        raise OllamaManagerError(f"Lost connection to Ollama\n{e}") from e
+
+    return result
+
+
+async def run_batch_async(
+    input_file: Path,
+    output: Path,
+    model: str,
+    concurrency: int,
+    ordered: bool,
+    resume: bool,
+) -> int:
+    """
+    Runs the batch, returning the number of failed requests.
+    """
+    if resume:
+        done = read_checkpoint(output)
+    else:
+        done = set()
+        output.unlink(missing_ok=True)
+
+    if done:
+        print(f">>> Resuming: {len(done)} request/s already in {output}")
+
+    client = get_ollama_client(
+        limits=httpx.Limits(
+            max_connections=concurrency, max_keepalive_connections=concurrency
+        )
+    )
+    completed = failed = tokens = 0
+    started = time.perf_counter()
+
+    def rate() -> str:
+        elapsed = time.perf_counter() - started
+        return (
+            f"{completed} done, {failed} failed | "
+            f"{completed / elapsed:.2f} req/s | {tokens / elapsed:.1f} tok/s"
+        )
+
+    console = Console()
+    with (
+        output.open("a", buffering=1) as out,
+        console.status("Running batch", spinner="dots") as status,
+        span("batch", model=model, concurrency=concurrency),
+    ):
+        results = bounded_map(
+            lambda item: run_request(client, model, *item),
+            read_requests(input_file, done),
+            limit=concurrency,
+            ordered=ordered,
+        )
+        async for result in results:
+            out.write(json.dumps(result) + "\n")
+            completed += 1
+            failed += "error" in result
+            tokens += result.get("eval_count") or 0
+            status.update(f"Running batch: {rate()}")
+
+    if failed:
+        print(
+            f"❌ Batch finished with {failed} failed request/s: {rate()}\n>>> {output}"
+        )
+    else:
+        print(f"✅ Batch complete: {rate()}\n>>> {output}")
+    return failed
+
+
+@click.command(name="batch")
+@click.argument(
+    "input_file", type=click.Path(exists=True, dir_okay=False, path_type=Path)
+)
+@click.option("--model", "-m", help="Model to run, prompts for one if omitted")
+@click.option(
+    "--output",
+    "-o",
+    type=click.Path(dir_okay=False, path_type=Path),
+    help="Output JSONL file. Default is <input>.out.jsonl",
+)
+@click.option(
+    "--concurrency",
+    "-c",
+    help="Maximum number of in-flight requests. Default is 4",
+    type=click.IntRange(min=1),
+    default=4,
+)
+@click.option(
+    "--unordered",
+    help="Write results as they complete instead of in input order",
+    is_flag=True,
+    default=False,
+)
+@click.option(
+    "--resume/--no-resume",
+    help="Skip requests already answered in the output file, retrying failed "
+    "ones. Default is to resume",
+    default=True,
+)
+@handle_errors
+def batch_run(
+    input_file: Path,
+    model: str | None,
+    output: Path | None,
+    concurrency: int,
+    unordered: bool,
+    resume: bool,
+):
+    """
+    Run a JSONL file of prompts through a model.
+
+    Each line is {"prompt": "...", "system": "...", "options": {...}} or
+    {"messages": [...]}, optionally with an "id" copied to the output.
+    """
+    if not model:
+        models = list_models()
+        if not models:
+            print("❌ No models available to run the batch")
+            sys.exit(0)
+        model = handle_interaction(
+            models, title="🚀 Select model for the batch:\n", multi_select=False
+        )[0].split()[0]
+
+    output = output or input_file.with_suffix(".out.jsonl")
+    failed = asyncio.run(
+        run_batch_async(
+            input_file,
+            output,
+            model,
+            concurrency=concurrency,
+            ordered=not unordered,
+            resume=resume,
+        )
+    )
+    if failed:
+        sys.exit(1)
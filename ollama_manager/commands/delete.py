@@ -1,9 +1,10 @@
+import asyncio
 import sys
 
 import click
-import ollama
 
-from ollama_manager.utils import handle_interaction, list_models
+from ollama_manager import api
+from ollama_manager.utils import handle_errors, handle_interaction, list_models
 
 
 @click.command(name="rm")
@@ -23,6 +24,7 @@ from ollama_manager.utils import handle_interaction, list_models
     default=False,
     is_flag=True,
 )
+@handle_errors
 def delete_model(multi: bool, yes: bool):
     """
     Deletes the selected model/s
@@ -37,6 +39,8 @@ def delete_model(multi: bool, yes: bool):
         sys.exit(0)
 
     if selections:
+        confirmed = []
+        declined = False
         for selection in selections:
             normalized_selection = selection.split()[0]
             if not yes:
@@ -44,11 +48,19 @@ def delete_model(multi: bool, yes: bool):
                     f"Are you sure you want to delete '\033[91m{normalized_selection}\033[0m'? \n[y(yes) | n(no)] "
                 )
 
-                if confirm.strip() in ("yes", "y"):
-                    ollama.delete(normalized_selection)
-                else:
-                    print("❌ Exited delete mode.")
-                    sys.exit(0)
-            else:
-                ollama.delete(normalized_selection)
-            print(f"🗑️ Deleted model: {normalized_selection}")
+                if confirm.strip() not in ("yes", "y"):
+                    declined = True
+                    break
+            confirmed.append(normalized_selection)
+
+        if confirmed:
+            asyncio.run(
+                api.delete_many(
+                    confirmed,
+                    on_deleted=lambda model: print(f"🗑️ Deleted model: {model}"),
+                )
+            )
+
+        if declined:
+            print("❌ Exited delete mode.")
+            sys.exit(0)
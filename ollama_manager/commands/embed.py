@@ -0,0 +1,249 @@
+import asyncio
+import json
+import sys
+import time
+from itertools import islice
+from pathlib import Path
+
+import click
+import httpx
+import ollama
+from rich.console import Console
+
+from ollama_manager.embeddings import DEFAULT_PATTERNS, NpyWriter, batched, iter_chunks
+from ollama_manager.exceptions import OllamaManagerError
+from ollama_manager.utils import handle_errors, handle_interaction, list_models
+from ollama_manager.utils.clients import get_ollama_client
+from ollama_manager.utils.concurrency import bounded_map
+from ollama_manager.utils.profiling import span
+
+# Rewrite the .npy header every this many batches
+CHECKPOINT_EVERY = 16
+
+
+async def embed_batch(
+    client: ollama.AsyncClient, model: str, chunks: list
+) -> tuple[list, list[list[float]]]:
+    try:
+        with span("ollama.embed", inputs=len(chunks)):
+            response = await client.embed(
+                model=model, input=[chunk.text for chunk in chunks], truncate=True
+            )
+    except ollama.ResponseError as e:
+        raise OllamaManagerError(f"Embedding failed: {e.error}") from e
+    except (ConnectionError, httpx.HTTPError) as e:
+        raise OllamaManagerError(f"Lost connection to Ollama\n{e}") from e
+
+    # A short response would shift every later row onto the wrong chunk id
+    if len(response.embeddings) != len(chunks):
+        raise OllamaManagerError(
+            f"Embedding failed: got {len(response.embeddings)} embeddings "
+            f"for {len(chunks)} chunks"
+        )
+
+    return chunks, response.embeddings
+
+
+def changed_settings(meta_path: Path, settings: dict) -> str | None:
+    """
+    Describes how `settings` differ from the ones recorded in `meta_path`.
+
+    Returns:
+        `None` when they match.
+    """
+    try:
+        recorded = json.loads(meta_path.read_text())
+    except (OSError, ValueError):
+        return f"{meta_path} is missing or unreadable"
+
+    changes = [
+        f"{key} {recorded.get(key)!r} -> {value!r}"
+        for key, value in settings.items()
+        if recorded.get(key) != value
+    ]
+    return ", ".join(changes) or None
+
+
+async def embed_corpus_async(
+    paths: tuple[Path, ...],
+    output: Path,
+    model: str,
+    chunk_size: int,
+    overlap: int,
+    batch_size: int,
+    concurrency: int,
+    patterns: tuple[str, ...],
+    resume: bool,
+):
+    data_path = output.with_suffix(".npy")
+    index_path = output.with_suffix(".ids.jsonl")
+    # Rows embedded with other settings must never be mixed into one matrix
+    meta_path = output.with_suffix(".meta.json")
+    settings = {"model": model, "chunk_size": chunk_size, "overlap": overlap}
+    if resume:
+        writer = NpyWriter.resume(data_path, index_path)
+    else:
+        writer = NpyWriter(data_path, index_path)
+
+    chunks = iter_chunks(paths, chunk_size, overlap, patterns)
+    if writer.rows:
+        changes = changed_settings(meta_path, settings)
+        if changes:
+            writer.close()
+            raise OllamaManagerError(
+                f"Settings changed since {data_path} was written ({changes}), "
+                "use --no-resume"
+            )
+        skipped = list(islice(chunks, writer.rows - 1, writer.rows))
+        if not skipped or skipped[0].id != writer.last_id:
+            writer.close()
+            raise OllamaManagerError(
+                f"Inputs changed since {index_path} was written, use --no-resume"
+            )
+        print(f">>> Resuming after {writer.rows} chunks")
+    else:
+        meta_path.write_text(json.dumps(settings) + "\n")
+
+    client = get_ollama_client(
+        limits=httpx.Limits(
+            max_connections=concurrency, max_keepalive_connections=concurrency
+        )
+    )
+    resumed_rows = writer.rows
+    started = time.perf_counter()
+
+    def rate() -> str:
+        embedded = writer.rows - resumed_rows
+        elapsed = time.perf_counter() - started
+        return f"{writer.rows} chunks | {embedded / elapsed:.1f} chunks/s"
+
+    console = Console()
+    with (
+        writer,
+        console.status("Embedding", spinner="dots") as status,
+        span("embed", model=model, concurrency=concurrency),
+    ):
+        results = bounded_map(
+            lambda batch: embed_batch(client, model, batch),
+            batched(chunks, batch_size),
+            limit=concurrency,
+        )
+        batches = 0
+        async for batch, embeddings in results:
+            writer.append([chunk.id for chunk in batch], embeddings)
+            batches += 1
+            if batches % CHECKPOINT_EVERY == 0:
+                writer.checkpoint()
+            status.update(f"Embedding: {rate()}")
+
+    if not writer.rows:
+        print("❌ No text found to embed")
+        sys.exit(1)
+
+    print(
+        f"✅ Embedded {rate()}\n"
+        f">>> {data_path} ({writer.rows} x {writer.dim} float32)\n"
+        f">>> {index_path}"
+    )
+
+
+@click.command(name="embed")
+@click.argument(
+    "paths",
+    nargs=-1,
+    required=True,
+    type=click.Path(exists=True, path_type=Path),
+)
+@click.option("--model", "-m", help="Embedding model, prompts for one if omitted")
+@click.option(
+    "--output",
+    "-o",
+    type=click.Path(dir_okay=False, path_type=Path),
+    default=Path("embeddings"),
+    show_default=True,
+    help="Output prefix for <prefix>.npy, <prefix>.ids.jsonl and <prefix>.meta.json",
+)
+@click.option(
+    "--glob",
+    "-g",
+    "patterns",
+    multiple=True,
+    help=f"File patterns to read from directories. Default is {' '.join(DEFAULT_PATTERNS)}",
+)
+@click.option(
+    "--chunk-size",
+    help="Maximum characters per chunk. Default is 2000",
+    type=click.IntRange(min=1),
+    default=2000,
+)
+@click.option(
+    "--overlap",
+    help="Characters shared by consecutive chunks. Default is 200",
+    type=click.IntRange(min=0),
+    default=200,
+)
+@click.option(
+    "--batch-size",
+    "-b",
+    help="Chunks per embed request. Default is 32",
+    type=click.IntRange(min=1),
+    default=32,
+)
+@click.option(
+    "--concurrency",
+    "-c",
+    help="Maximum number of in-flight requests. Default is 4",
+    type=click.IntRange(min=1),
+    default=4,
+)
+@click.option(
+    "--resume/--no-resume",
+    help="Continue from existing output written with the same model and "
+    "chunking. Default is to resume",
+    default=True,
+)
+@handle_errors
+def embed_corpus(
+    paths: tuple[Path, ...],
+    model: str | None,
+    output: Path,
+    patterns: tuple[str, ...],
+    chunk_size: int,
+    overlap: int,
+    batch_size: int,
+    concurrency: int,
+    resume: bool,
+):
+    """
+    Embed files and directories into a float32 .npy matrix.
+
+    Row i of <prefix>.npy is the embedding of the chunk on line i of
+    <prefix>.ids.jsonl. Load it with numpy.load(path, mmap_mode="r").
+    """
+    if overlap >= chunk_size:
+        raise click.BadParameter(
+            "must be smaller than --chunk-size", param_hint="--overlap"
+        )
+
+    if not model:
+        models = list_models()
+        if not models:
+            print("❌ No models available to embed with")
+            sys.exit(0)
+        model = handle_interaction(
+            models, title="🧮 Select embedding model:\n", multi_select=False
+        )[0].split()[0]
+
+    asyncio.run(
+        embed_corpus_async(
+            paths,
+            output,
+            model,
+            chunk_size=chunk_size,
+            overlap=overlap,
+            batch_size=batch_size,
+            concurrency=concurrency,
+            patterns=patterns or DEFAULT_PATTERNS,
+            resume=resume,
+        )
+    )
@@ -1,8 +1,12 @@
+import asyncio
+import math
+
 import click
-import ollama
 from rich.console import Console
 from rich.table import Table
-from ollama_manager.utils import convert_bytes, humanized_relative_time
+from ollama_manager.inventory import inventory
+from ollama_manager.utils import handle_errors, humanized_relative_time
+from ollama_manager.utils.profiling import span
 
 
 @click.command(name="list")
@@ -20,21 +24,52 @@ from ollama_manager.utils import convert_bytes, humanized_relative_time
     default="asc",
     help="Sort order (ascending or descending)",
 )
-def list_ollama_models(sort, order):
+@click.option(
+    "--filter",
+    "-f",
+    "name_filter",
+    type=str,
+    help="Only list models whose name contains the text (supports * ? [] globs)",
+)
+@click.option(
+    "--limit",
+    "-l",
+    type=click.IntRange(min=1),
+    help="Maximum number of models to show per page",
+)
+@click.option(
+    "--page",
+    "-p",
+    type=click.IntRange(min=1),
+    default=1,
+    help="Page to show when using --limit. Default is 1",
+)
+@handle_errors
+def list_ollama_models(sort, order, name_filter, limit, page):
     """
     List your ollama models
     """
-    model_metadata = ollama.list()
-    models = model_metadata.models
+    offset = (page - 1) * limit if limit else 0
+    models, total = asyncio.run(
+        inventory.query(
+            sort=sort, order=order, filter=name_filter, limit=limit, offset=offset
+        )
+    )
+    pages = page_count(total, limit)
+    if page > pages:
+        raise click.BadParameter(
+            f"{page} is past the last page ({pages})", param_hint="'--page'"
+        )
+
+    with span("render", rows=len(models)):
+        render_table(models, total, limit, page)
+
+
+def page_count(total: int, limit: int | None) -> int:
+    return max(math.ceil(total / limit), 1) if limit else 1
 
-    # Sort models based on user preference
-    if sort == "name":
-        models.sort(key=lambda m: m.model, reverse=(order == "desc"))
-    elif sort == "date":
-        models.sort(key=lambda m: m.modified_at, reverse=(order == "desc"))
-    elif sort == "size":
-        models.sort(key=lambda m: m.size, reverse=(order == "desc"))
 
+def render_table(models: list, total: int, limit: int | None, page: int):
     console = Console()
     table = Table(title="Ollama Models")
 
@@ -44,10 +79,12 @@ def list_ollama_models(sort, order):
 
     # Add rows
     for model in models:
-        model_name = model.model
-        modified_date = humanized_relative_time(str(model.modified_at))
-        size = convert_bytes(model.size)
+        modified_date = (
+            humanized_relative_time(model.modified_at) if model.modified_at else ""
+        )
+        table.add_row(model.name, modified_date, model.size_label)
 
-        table.add_row(model_name, modified_date, size)
+    if limit:
+        table.caption = f"Page {page} of {page_count(total, limit)} ({total} models)"
 
     console.print(table)
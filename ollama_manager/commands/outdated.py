@@ -0,0 +1,160 @@
+import asyncio
+import sys
+
+import click
+from rich.console import Console
+from rich.progress import (
+    BarColumn,
+    DownloadColumn,
+    Progress,
+    TextColumn,
+    TransferSpeedColumn,
+)
+from rich.table import Table
+
+from ollama_manager import api
+from ollama_manager.utils import handle_errors
+
+
+async def check_updates_async(
+    models: tuple[str, ...], concurrency: int
+) -> list[api.ModelUpdate]:
+    console = Console()
+    with console.status("Checking registry manifests", spinner="dots"):
+        return await api.check_updates(
+            models=list(models) or None, concurrency=concurrency
+        )
+
+
+def print_updates(updates: list[api.ModelUpdate], show_all: bool):
+    table = Table(title="Model Updates")
+    table.add_column("Model Name", style="bright_cyan")
+    table.add_column("Local", style="bright_yellow")
+    table.add_column("Remote", style="bright_green")
+    table.add_column("Status")
+
+    for update in updates:
+        if update.error:
+            status = "[bright_red]unavailable[/]"
+        elif update.outdated:
+            status = "[bright_yellow]outdated[/]"
+        elif show_all:
+            status = "[bright_green]up to date[/]"
+        else:
+            continue
+
+        table.add_row(
+            update.name,
+            update.local_digest[:12],
+            (update.remote_digest or "")[:12],
+            status,
+        )
+
+    Console().print(table)
+
+
+async def upgrade_models_async(models: list[str], parallel: int):
+    with Progress(
+        TextColumn("{task.description}"),
+        BarColumn(),
+        DownloadColumn(),
+        TransferSpeedColumn(),
+    ) as progress:
+        tasks = {model: progress.add_task(model, total=None) for model in models}
+
+        def on_progress(update: api.PullProgress):
+            progress.update(
+                tasks[update.model],
+                completed=update.completed or 0,
+                total=update.total,
+                description=f"{update.model} [dim]{update.status}[/]",
+            )
+
+        return await api.pull_many(models, concurrency=parallel, progress=on_progress)
+
+
+@click.command(name="outdated")
+@click.argument("models", nargs=-1)
+@click.option(
+    "--all",
+    "-a",
+    "show_all",
+    help="Also show models that are up to date",
+    is_flag=True,
+    default=False,
+)
+@click.option(
+    "--concurrency",
+    "-c",
+    help="Maximum number of concurrent registry requests. Default is 8",
+    type=click.IntRange(min=1),
+    default=8,
+)
+@handle_errors
+def outdated_models(models: tuple[str, ...], show_all: bool, concurrency: int):
+    """
+    List local models that are behind their registry
+    """
+    updates = asyncio.run(check_updates_async(models, concurrency))
+    stale = [update for update in updates if update.outdated]
+
+    if not show_all and not any(update.outdated or update.error for update in updates):
+        print("✅ All models are up to date!")
+        return
+
+    print_updates(updates, show_all)
+    if stale:
+        print(f"\n>>> olm upgrade  # to pull {len(stale)} outdated model/s")
+
+
+@click.command(name="upgrade")
+@click.argument("models", nargs=-1)
+@click.option(
+    "--parallel",
+    "-j",
+    help="Number of models to pull in parallel. Default is 2",
+    type=click.IntRange(min=1),
+    default=2,
+)
+@click.option(
+    "--concurrency",
+    "-c",
+    help="Maximum number of concurrent registry requests. Default is 8",
+    type=click.IntRange(min=1),
+    default=8,
+)
+@click.option(
+    "--yes",
+    "-y",
+    help="Skip confirmation prompt",
+    is_flag=True,
+    default=False,
+)
+@handle_errors
+def upgrade_models(models: tuple[str, ...], parallel: int, concurrency: int, yes: bool):
+    """
+    Pull only the local models that are behind their registry
+    """
+    updates = asyncio.run(check_updates_async(models, concurrency))
+    stale = [update.name for update in updates if update.outdated]
+
+    if not stale:
+        print("✅ All models are up to date!")
+        return
+
+    print_updates(updates, show_all=False)
+    if not yes:
+        confirm = input(f"Pull {len(stale)} outdated model/s? \n[y(yes) | n(no)] ")
+        if confirm.strip() not in ("yes", "y"):
+            print("❌ Exited upgrade mode.")
+            sys.exit(0)
+
+    errors = asyncio.run(upgrade_models_async(stale, parallel))
+    for model in stale:
+        if model in errors:
+            print(f"❌ {errors[model]}")
+        else:
+            print(f"✅ {model} is up to date!")
+
+    if errors:
+        sys.exit(1)
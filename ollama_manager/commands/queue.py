@@ -0,0 +1,151 @@
+import datetime
+import sys
+
+import click
+from rich.console import Console
+from rich.live import Live
+from rich.table import Table
+
+from ollama_manager import daemon
+from ollama_manager.utils import format_bytes, handle_errors, humanized_relative_time
+
+STATUS_STYLES = {
+    "queued": "bright_blue",
+    "running": "bright_yellow",
+    "done": "bright_green",
+    "failed": "bright_red",
+    "cancelled": "dim",
+}
+
+
+def jobs_table(jobs: list[dict]) -> Table:
+    table = Table(title="Pull Queue")
+    table.add_column("ID", justify="right")
+    table.add_column("Model Name", style="bright_cyan")
+    table.add_column("Status")
+    table.add_column("Progress", justify="right")
+    table.add_column("Updated")
+    table.add_column("Detail", style="dim", overflow="fold")
+
+    for job in jobs:
+        progress = ""
+        if job["total"]:
+            percent = (job["completed"] or 0) / job["total"]
+            progress = (
+                f"{percent:.0%} of {format_bytes(job['total'])}"
+                if job["status"] != "done"
+                else format_bytes(job["total"])
+            )
+        style = STATUS_STYLES.get(job["status"], "")
+        table.add_row(
+            str(job["id"]),
+            job["model"],
+            f"[{style}]{job['status']}[/]",
+            progress,
+            humanized_relative_time(
+                datetime.datetime.fromtimestamp(
+                    job["updated_at"], tz=datetime.timezone.utc
+                )
+            ),
+            job["error"] or (job["detail"] if job["status"] == "running" else ""),
+        )
+    return table
+
+
+def watch_jobs(ids: list[int] | None = None):
+    with Live(jobs_table([]), console=Console(), auto_refresh=False) as live:
+        try:
+            for snapshot in daemon.watch(ids):
+                live.update(jobs_table(snapshot["jobs"]), refresh=True)
+        except KeyboardInterrupt:
+            pass
+
+
+@click.group(name="queue")
+def queue_group():
+    """
+    Pull models in the background with a local daemon.
+
+    Queued pulls keep running after the terminal closes, at most
+    OLM_QUEUE_CONCURRENCY (default 2) at a time.
+    """
+
+
+@queue_group.command(name="add")
+@click.argument("models", nargs=-1, required=True)
+@click.option(
+    "--watch",
+    "-w",
+    help="Follow the progress of the queued pulls",
+    is_flag=True,
+    default=False,
+)
+@handle_errors
+def queue_add(models: tuple[str, ...], watch: bool):
+    """
+    Queue models to pull, e.g. olm queue add llama3.2 qwen3:4b
+    """
+    daemon.ensure_daemon()
+    jobs = daemon.request({"op": "add", "models": list(models)})["jobs"]
+    for job in jobs:
+        if job["deduplicated"]:
+            print(f">>> {job['model']} is already {job['status']} as job {job['id']}")
+        else:
+            print(f"✅ Queued {job['model']} as job {job['id']}")
+
+    if watch:
+        watch_jobs([job["id"] for job in jobs])
+
+
+@queue_group.command(name="status")
+@click.option(
+    "--watch",
+    "-w",
+    help="Keep refreshing until interrupted",
+    is_flag=True,
+    default=False,
+)
+@handle_errors
+def queue_status(watch: bool):
+    """
+    Show queued, running and recently finished pulls.
+    """
+    daemon.ensure_daemon()
+    if watch:
+        watch_jobs()
+        return
+
+    jobs = daemon.request({"op": "status"})["jobs"]
+    if not jobs:
+        print("❌ The pull queue is empty\n\n>>> olm queue add <model>")
+        sys.exit(0)
+    Console().print(jobs_table(jobs))
+
+
+@queue_group.command(name="cancel")
+@click.argument("targets", nargs=-1)
+@click.option(
+    "--all",
+    "-a",
+    "cancel_all",
+    help="Cancel every queued and running pull",
+    is_flag=True,
+    default=False,
+)
+@handle_errors
+def queue_cancel(targets: tuple[str, ...], cancel_all: bool):
+    """
+    Cancel pulls by job ID or model name.
+    """
+    if not targets and not cancel_all:
+        print("❌ Pass job IDs or model names to cancel, or --all")
+        sys.exit(1)
+
+    daemon.ensure_daemon()
+    targets = ["all"] if cancel_all else list(targets)
+    jobs = daemon.request({"op": "cancel", "targets": targets})["jobs"]
+    if not jobs:
+        print("❌ No matching queued or running pulls")
+        sys.exit(1)
+    for job in jobs:
+        print(f"🗑️ Cancelled {job['model']} (job {job['id']})")
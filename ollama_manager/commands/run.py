@@ -5,7 +5,13 @@ from pathlib import Path
 
 import click
 
-from ollama_manager.utils import handle_interaction, list_models
+from ollama_manager.utils import (
+    handle_errors,
+    handle_interaction,
+    list_models,
+    with_default_tag,
+)
+from ollama_manager.utils.profiling import span
 
 
 def streamlit_check():
@@ -24,14 +30,37 @@ To use it install the optional dependency:
         sys.exit(1)
 
 
+def resolve_models(names: str, models: list[str]) -> list[str]:
+    """
+    Matches comma separated model names against the local models, an untagged
+    name matches its `latest` tag.
+    """
+    local_names = [model.split()[0] for model in models]
+    resolved = []
+    for name in filter(None, (name.strip() for name in names.split(","))):
+        if name not in local_names:
+            name = with_default_tag(name)
+        if name not in local_names:
+            print(f"❌ Model not found locally: '{name}'")
+            sys.exit(1)
+        resolved.append(name)
+    return resolved
+
+
 @click.option(
     "--ui",
     "-ui",
-    help="Run ollama models in a Streamlit UI, use either 'text' or 'vision'",
+    help="Run ollama models in a Streamlit UI, use 'text', 'vision' or 'compare'",
+    type=str,
+)
+@click.option(
+    "--compare",
+    help="Compare comma separated models side by side in a Streamlit UI",
     type=str,
 )
 @click.command(name="run")
-def run_model(ui: bool):
+@handle_errors
+def run_model(ui: bool, compare: str | None):
     """
     Run the selected Ollama model.
     By default, uses Ollama terminal UI.
@@ -40,29 +69,41 @@ def run_model(ui: bool):
 
     >> pip install ollama-manager[ui]
 
+    To stream one prompt through several models side by side:
+
+    >> olm run --compare llama3.2:1b,llama3.2:3b
+
     ⚠️ Only text models are supported for now.
     """
     models = list_models()
-    if ui and ui.strip() not in ["text", "vision", ""]:
+    if compare:
+        ui = "compare"
+    if ui and ui.strip() not in ["text", "vision", "compare", ""]:
         print(
             f"❌ Invalid UI option: '{ui.strip()}'.\n"
-            "Please use 'text' or 'vision'.\n\n"
+            "Please use 'text', 'vision' or 'compare'.\n\n"
             "⚠️ Only text models are supported for now."
         )
         sys.exit(1)
 
-    if models:
+    if not models:
+        print("❌ No models selected for running with Streamlit UI")
+        sys.exit(0)
+    elif compare:
+        selection = resolve_models(compare, models)
+    elif ui and ui.strip() == "compare":
         selection = handle_interaction(
-            models, title="🚀 Select model to run:\n", multi_select=False
+            models, title="⚖️ Select models to compare:\n", multi_select=True
         )
     else:
-        print("❌ No models selected for running with Streamlit UI")
-        sys.exit(0)
+        selection = handle_interaction(
+            models, title="🚀 Select model to run:\n", multi_select=False
+        )
 
     if selection:
-        normalized_selection = selection[0].split()[0]
+        normalized_selection = [model.split()[0] for model in selection]
         if not ui:
-            command = ["ollama", "run", normalized_selection]
+            command = ["ollama", "run", normalized_selection[0]]
         else:
             base_path = Path(os.path.abspath(__file__)).parent.parent / "ui"
             script_path = base_path / "text_chat.py"
@@ -70,11 +111,20 @@ def run_model(ui: bool):
                 script_path = base_path / "text_chat.py"
             elif ui.strip() == "vision":
                 script_path = base_path / "image_chat.py"
+            elif ui.strip() == "compare":
+                script_path = base_path / "compare_chat.py"
 
-            command = ["streamlit", "run", str(script_path), "--", normalized_selection]
+            command = [
+                "streamlit",
+                "run",
+                str(script_path),
+                "--",
+                *normalized_selection,
+            ]
 
         try:
-            process = subprocess.Popen(command)
-            process.wait()
+            with span("run", command=command[0]):
+                process = subprocess.Popen(command)
+                process.wait()
         except Exception as e:
             print(f"Error running app: {e}")
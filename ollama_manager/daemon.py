@@ -0,0 +1,469 @@
+"""
+Background pull queue served by a local daemon.
+
+Jobs live in a SQLite store so they survive the terminal that queued them and
+restarts of the daemon itself. The daemon pulls queued models at most
+`OLM_QUEUE_CONCURRENCY` at a time and answers newline delimited JSON requests
+on a Unix socket:
+
+    {"op": "add", "models": ["llama3.2"]}   -> {"jobs": [...]}
+    {"op": "status"}                        -> {"jobs": [...]}
+    {"op": "cancel", "targets": ["3"]}      -> {"jobs": [...]}
+    {"op": "watch", "ids": [3]}             -> {"jobs": [...]} per change
+
+The daemon is started on demand by `ensure_daemon` and exits once it has
+been idle for `OLM_QUEUE_IDLE_TIMEOUT` seconds.
+
+>> python -m ollama_manager.daemon
+"""
+
+import asyncio
+import contextlib
+import fcntl
+import json
+import os
+import socket
+import subprocess
+import sys
+import time
+import traceback
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Iterator
+
+from ollama_manager import api
+from ollama_manager.exceptions import OllamaManagerError
+from ollama_manager.utils import get_data_dir, with_default_tag
+from ollama_manager.utils.storage import SQLiteStore
+
+DEFAULT_CONCURRENCY = int(os.environ.get("OLM_QUEUE_CONCURRENCY", 2))
+IDLE_TIMEOUT = float(os.environ.get("OLM_QUEUE_IDLE_TIMEOUT", 300))
+# Running jobs write their progress to the store at most this often
+PERSIST_INTERVAL = 1.0
+# Watchers get at most this many snapshots per second
+WATCH_INTERVAL = 0.5
+STARTUP_TIMEOUT = 10.0
+FINISHED_SHOWN = 20
+
+ACTIVE = ("queued", "running")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id INTEGER PRIMARY KEY,
+    model TEXT NOT NULL,
+    status TEXT NOT NULL,
+    completed INTEGER,
+    total INTEGER,
+    detail TEXT,
+    error TEXT,
+    created_at REAL NOT NULL,
+    updated_at REAL NOT NULL
+);
+CREATE UNIQUE INDEX IF NOT EXISTS jobs_active_model
+    ON jobs (model) WHERE status IN ('queued', 'running');
+"""
+
+
+def socket_path() -> Path:
+    return Path(os.environ.get("OLM_QUEUE_SOCKET") or get_data_dir() / "queue.sock")
+
+
+@dataclass(slots=True)
+class Job:
+    id: int
+    model: str
+    status: str
+    completed: int | None
+    total: int | None
+    detail: str | None
+    error: str | None
+    created_at: float
+    updated_at: float
+
+    @property
+    def active(self) -> bool:
+        return self.status in ACTIVE
+
+
+class JobStore(SQLiteStore):
+    """
+    Pull jobs persisted in SQLite. At most one queued or running job exists
+    per model, adding it again returns that job.
+
+    Args:
+        path: Database file, defaults to `queue.sqlite3` in the data dir.
+    """
+
+    def __init__(self, path: Path | None = None):
+        super().__init__(path or get_data_dir() / "queue.sqlite3", SCHEMA)
+
+    def _jobs(self, where: str, params: tuple = ()) -> list[Job]:
+        rows = self._db.execute(
+            "SELECT id, model, status, completed, total, detail, error, "
+            f"created_at, updated_at FROM jobs {where}",
+            params,
+        ).fetchall()
+        return [Job(*row) for row in rows]
+
+    def add(self, model: str) -> tuple[Job, bool]:
+        """
+        Queues `model`, returning the job and whether it was newly created.
+        """
+        now = time.time()
+        with self._db:
+            existing = self._jobs(
+                "WHERE model = ? AND status IN ('queued', 'running')", (model,)
+            )
+            if existing:
+                return existing[0], False
+            cursor = self._db.execute(
+                "INSERT INTO jobs (model, status, created_at, updated_at) "
+                "VALUES (?, 'queued', ?, ?)",
+                (model, now, now),
+            )
+        return self.get(cursor.lastrowid), True
+
+    def get(self, job_id: int) -> Job | None:
+        jobs = self._jobs("WHERE id = ?", (job_id,))
+        return jobs[0] if jobs else None
+
+    def next_queued(self) -> Job | None:
+        jobs = self._jobs("WHERE status = 'queued' ORDER BY id LIMIT 1")
+        return jobs[0] if jobs else None
+
+    def active(self) -> list[Job]:
+        return self._jobs("WHERE status IN ('queued', 'running') ORDER BY id")
+
+    def recent(self, finished: int = FINISHED_SHOWN) -> list[Job]:
+        """
+        Active jobs followed by the most recently finished ones.
+        """
+        done = self._jobs(
+            "WHERE status NOT IN ('queued', 'running') "
+            "ORDER BY updated_at DESC LIMIT ?",
+            (finished,),
+        )
+        return self.active() + done[::-1]
+
+    def save(self, job: Job):
+        job.updated_at = time.time()
+        with self._db:
+            self._db.execute(
+                "UPDATE jobs SET status = ?, completed = ?, total = ?, detail = ?, "
+                "error = ?, updated_at = ? WHERE id = ?",
+                (
+                    job.status,
+                    job.completed,
+                    job.total,
+                    job.detail,
+                    job.error,
+                    job.updated_at,
+                    job.id,
+                ),
+            )
+
+    def requeue_running(self):
+        """
+        Puts jobs interrupted by a daemon exit back in the queue, Ollama
+        resumes their partial downloads.
+        """
+        with self._db:
+            self._db.execute(
+                "UPDATE jobs SET status = 'queued' WHERE status = 'running'"
+            )
+
+
+class PullDaemon:
+    """
+    Pulls queued jobs with a global concurrency limit and serves the socket
+    protocol described in the module docstring.
+
+    Args:
+        store: Job store, shared with nothing else while the daemon runs.
+        concurrency: Maximum number of simultaneous pulls.
+        idle_timeout: Seconds without jobs or clients before exiting.
+    """
+
+    def __init__(
+        self,
+        store: JobStore,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        idle_timeout: float = IDLE_TIMEOUT,
+    ):
+        self.store = store
+        self.concurrency = max(concurrency, 1)
+        self.idle_timeout = idle_timeout
+        self.running: dict[int, tuple[Job, asyncio.Task]] = {}
+        self.clients = 0
+        self.last_activity = time.monotonic()
+        self._changed = asyncio.Event()
+
+    def notify(self):
+        self.last_activity = time.monotonic()
+        self._changed.set()
+        self._changed = asyncio.Event()
+
+    def jobs(self) -> list[Job]:
+        """
+        Stored jobs with the live progress of running ones.
+        """
+        return [
+            self.running[job.id][0] if job.id in self.running else job
+            for job in self.store.recent()
+        ]
+
+    def schedule(self):
+        while len(self.running) < self.concurrency:
+            job = self.store.next_queued()
+            if job is None:
+                break
+            job.status = "running"
+            self.store.save(job)
+            task = asyncio.create_task(self.run_job(job))
+            self.running[job.id] = (job, task)
+        self.notify()
+
+    async def run_job(self, job: Job):
+        persisted = 0.0
+
+        def on_progress(update: api.PullProgress):
+            nonlocal persisted
+            job.detail = update.status
+            if update.total:
+                job.completed = update.completed or 0
+                job.total = update.total
+            if time.monotonic() - persisted > PERSIST_INTERVAL:
+                persisted = time.monotonic()
+                self.store.save(job)
+            self.notify()
+
+        try:
+            await api.pull(job.model, progress=on_progress)
+            job.status = "done"
+        except OllamaManagerError as e:
+            job.status = "failed"
+            job.error = str(e)
+        except asyncio.CancelledError:
+            job.status = "cancelled"
+        except Exception as e:
+            # Anything else would leave the job "running" and dedupe every
+            # later add of the model onto it until the daemon restarts
+            traceback.print_exc()
+            job.status = "failed"
+            job.error = f"Unexpected error: {e!r}"
+        finally:
+            self.store.save(job)
+            del self.running[job.id]
+            self.schedule()
+            self.notify()
+
+    def add(self, models: list[str]) -> list[dict]:
+        results = []
+        for model in models:
+            job, created = self.store.add(with_default_tag(model.strip()))
+            results.append({**asdict(job), "deduplicated": not created})
+        self.schedule()
+        return results
+
+    def cancel(self, targets: list[str]) -> list[dict]:
+        """
+        Cancels active jobs matching ids or model names, `all` cancels every one.
+        """
+        cancelled = []
+        for job in self.store.active():
+            if not (
+                "all" in targets
+                or str(job.id) in targets
+                or job.model in targets
+                or job.model in map(with_default_tag, targets)
+            ):
+                continue
+            if job.id in self.running:
+                job, task = self.running[job.id]
+                task.cancel()
+            job.status = "cancelled"
+            self.store.save(job)
+            cancelled.append(asdict(job))
+        self.notify()
+        return cancelled
+
+    async def watch(
+        self,
+        reader: asyncio.StreamReader,
+        writer: asyncio.StreamWriter,
+        ids: list[int] | None,
+    ):
+        """
+        Streams job snapshots to a watcher until its jobs finish or it hangs up.
+        """
+        # Watchers send nothing after the request, so this only completes at EOF
+        disconnected = asyncio.ensure_future(reader.read())
+        try:
+            while True:
+                changed = self._changed
+                jobs = self.jobs()
+                if ids:
+                    jobs = [job for job in jobs if job.id in ids]
+                writer.write(self.encode({"jobs": [asdict(job) for job in jobs]}))
+                await writer.drain()
+                if ids and not any(job.active for job in jobs):
+                    return
+                await asyncio.sleep(WATCH_INTERVAL)
+                waiter = asyncio.ensure_future(changed.wait())
+                await asyncio.wait(
+                    (waiter, disconnected), return_when=asyncio.FIRST_COMPLETED
+                )
+                waiter.cancel()
+                if disconnected.done():
+                    return
+        finally:
+            disconnected.cancel()
+
+    @staticmethod
+    def encode(payload: dict) -> bytes:
+        return json.dumps(payload).encode() + b"\n"
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self.clients += 1
+        try:
+            line = await reader.readline()
+            request = json.loads(line or b"{}")
+            op = request.get("op")
+            if op == "watch":
+                await self.watch(reader, writer, request.get("ids"))
+                return
+
+            if op == "add":
+                response = {"jobs": self.add(request.get("models") or [])}
+            elif op == "status":
+                response = {"jobs": [asdict(job) for job in self.jobs()]}
+            elif op == "cancel":
+                response = {"jobs": self.cancel(request.get("targets") or [])}
+            elif op == "ping":
+                response = {"pid": os.getpid(), "concurrency": self.concurrency}
+            else:
+                response = {"error": f"Unknown operation: {op}"}
+            writer.write(self.encode(response))
+            await writer.drain()
+        except (ValueError, ConnectionError):
+            pass
+        finally:
+            self.clients -= 1
+            self.last_activity = time.monotonic()
+            writer.close()
+
+    def idle(self) -> bool:
+        return (
+            not self.running
+            and not self.clients
+            and self.store.next_queued() is None
+            and time.monotonic() - self.last_activity > self.idle_timeout
+        )
+
+    async def serve(self, path: Path):
+        self.store.requeue_running()
+        server = await asyncio.start_unix_server(self.handle, path=str(path))
+        os.chmod(path, 0o600)
+        self.schedule()
+        async with server:
+            while not self.idle():
+                await asyncio.sleep(min(self.idle_timeout, 5))
+        path.unlink(missing_ok=True)
+
+
+def serve_daemon(
+    path: Path | None = None,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    idle_timeout: float = IDLE_TIMEOUT,
+):
+    """
+    Runs the daemon until it goes idle, unless another one already holds the
+    lock next to `path`.
+    """
+    path = path or socket_path()
+    with open(path.with_suffix(".lock"), "w") as lock:
+        try:
+            fcntl.flock(lock, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            print(f"Pull queue daemon already running on {path}")
+            return
+
+        print(f"Pull queue daemon {os.getpid()} serving on {path}", flush=True)
+        store = JobStore()
+        try:
+            asyncio.run(PullDaemon(store, concurrency, idle_timeout).serve(path))
+        finally:
+            store.close()
+
+
+def _connect(path: Path, timeout: float | None) -> socket.socket:
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    sock.settimeout(timeout)
+    try:
+        sock.connect(str(path))
+    except OSError:
+        sock.close()
+        raise
+    return sock
+
+
+def request(payload: dict, path: Path | None = None, timeout: float = 10.0) -> dict:
+    """
+    Sends one request to the daemon and returns its response.
+    """
+    with _connect(path or socket_path(), timeout) as sock:
+        sock.sendall(json.dumps(payload).encode() + b"\n")
+        with sock.makefile("rb") as stream:
+            response = json.loads(stream.readline() or b"{}")
+
+    if "error" in response:
+        raise OllamaManagerError(response["error"])
+    return response
+
+
+def watch(ids: list[int] | None = None, path: Path | None = None) -> Iterator[dict]:
+    """
+    Yields job snapshots as they change, until the jobs in `ids` finish or
+    forever when `ids` is empty.
+    """
+    with _connect(path or socket_path(), None) as sock:
+        sock.sendall(json.dumps({"op": "watch", "ids": ids}).encode() + b"\n")
+        with sock.makefile("rb") as stream:
+            for line in stream:
+                yield json.loads(line)
+
+
+def ensure_daemon(path: Path | None = None):
+    """
+    Starts the daemon in the background unless it is already answering.
+    """
+    path = path or socket_path()
+    with contextlib.suppress(OSError):
+        request({"op": "ping"}, path=path)
+        return
+
+    log = open(get_data_dir() / "queue.log", "ab")
+    subprocess.Popen(
+        [sys.executable, "-m", "ollama_manager.daemon"],
+        stdin=subprocess.DEVNULL,
+        stdout=log,
+        stderr=subprocess.STDOUT,
+        start_new_session=True,
+        env={**os.environ, "OLM_QUEUE_SOCKET": str(path)},
+    )
+    log.close()
+
+    deadline = time.monotonic() + STARTUP_TIMEOUT
+    while time.monotonic() < deadline:
+        time.sleep(0.1)
+        with contextlib.suppress(OSError):
+            request({"op": "ping"}, path=path)
+            return
+
+    raise OllamaManagerError(
+        f"Pull queue daemon did not start, see {get_data_dir() / 'queue.log'}"
+    )
+
+
+if __name__ == "__main__":
+    serve_daemon()
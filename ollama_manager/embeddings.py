@@ -0,0 +1,241 @@
+"""
+Corpus chunking and a dependency-free writer for float32 `.npy` matrices.
+
+Embeddings are appended row by row to a `.npy` file whose header is reserved
+up front and rewritten with the current shape at checkpoints, so the output
+loads with `numpy.load(path, mmap_mode="r")` without numpy being installed
+here. Each row has a matching line in a JSONL index naming the chunk it came
+from.
+"""
+
+import array
+import ast
+import fnmatch
+import json
+import os
+import sys
+from dataclasses import dataclass
+from itertools import islice
+from pathlib import Path
+from typing import Iterable, Iterator, TypeVar
+
+from ollama_manager.exceptions import OllamaManagerError
+
+T = TypeVar("T")
+
+DEFAULT_PATTERNS = ("*.md", "*.txt", "*.rst")
+NPY_MAGIC = b"\x93NUMPY\x01\x00"
+# Magic, header length and the padded header dict, a multiple of 64 bytes
+NPY_HEADER_SIZE = 128
+
+
+@dataclass(slots=True)
+class Chunk:
+    path: str
+    start: int
+    end: int
+    text: str
+
+    @property
+    def id(self) -> dict:
+        return {"path": self.path, "start": self.start, "end": self.end}
+
+
+def walk_files(paths: Iterable[Path], patterns: Iterable[str]) -> Iterator[Path]:
+    """
+    Lazily yields files in a stable order.
+
+    Files given explicitly are always yielded, directories are walked
+    recursively for files matching any of `patterns`.
+    """
+    patterns = tuple(patterns)
+    for path in paths:
+        if path.is_file():
+            yield path
+            continue
+        for root, dirs, files in os.walk(path):
+            dirs[:] = sorted(d for d in dirs if not d.startswith("."))
+            for name in sorted(files):
+                if any(fnmatch.fnmatch(name, pattern) for pattern in patterns):
+                    yield Path(root) / name
+
+
+def chunk_text(text: str, size: int, overlap: int) -> Iterator[tuple[int, int]]:
+    """
+    Splits `text` into `(start, end)` windows of at most `size` characters.
+
+    Windows end on a paragraph break or whitespace in their last fifth when
+    there is one, and the next window starts `overlap` characters earlier.
+    """
+    start = 0
+    length = len(text)
+    while start < length:
+        end = min(start + size, length)
+        if end < length:
+            floor = start + size * 4 // 5
+            cut = text.rfind("\n\n", floor, end)
+            if cut == -1:
+                cut = max(text.rfind(" ", floor, end), text.rfind("\n", floor, end))
+            if cut > start:
+                end = cut + 1
+        if text[start:end].strip():
+            yield start, end
+        if end == length:
+            return
+        start = max(end - overlap, start + 1)
+
+
+def iter_chunks(
+    paths: Iterable[Path],
+    size: int,
+    overlap: int,
+    patterns: Iterable[str] = DEFAULT_PATTERNS,
+) -> Iterator[Chunk]:
+    """
+    Lazily yields chunks of every file under `paths`, one file in memory at a time.
+    """
+    for path in walk_files(paths, patterns):
+        try:
+            text = path.read_text(errors="replace")
+        except OSError as e:
+            print(f"❌ Skipping {path}: {e}", file=sys.stderr)
+            continue
+        for start, end in chunk_text(text, size, overlap):
+            yield Chunk(str(path), start, end, text[start:end])
+
+
+def batched(items: Iterable[T], size: int) -> Iterator[list[T]]:
+    iterator = iter(items)
+    while batch := list(islice(iterator, size)):
+        yield batch
+
+
+def _npy_header(rows: int, dim: int) -> bytes:
+    header = repr({"descr": "<f4", "fortran_order": False, "shape": (rows, dim)})
+    padding = NPY_HEADER_SIZE - len(NPY_MAGIC) - 2 - len(header) - 1
+    header = (header + " " * padding + "\n").encode("latin1")
+    return NPY_MAGIC + len(header).to_bytes(2, "little") + header
+
+
+def read_npy_shape(path: Path) -> tuple[int, int]:
+    """
+    Reads the `(rows, dim)` recorded in the header of a file written by `NpyWriter`.
+    """
+    with path.open("rb") as file:
+        prefix = file.read(len(NPY_MAGIC) + 2)
+        if len(prefix) < len(NPY_MAGIC) + 2 or prefix[:6] != NPY_MAGIC[:6]:
+            raise OllamaManagerError(f"{path} is not a .npy file")
+        header = file.read(int.from_bytes(prefix[-2:], "little"))
+
+    meta = ast.literal_eval(header.decode("latin1"))
+    if meta.get("descr") != "<f4" or len(meta.get("shape", ())) != 2:
+        raise OllamaManagerError(f"{path} is not a float32 matrix")
+    return meta["shape"]
+
+
+class NpyWriter:
+    """
+    Appends float32 rows to a 2D `.npy` file and a JSONL id index.
+
+    The header is rewritten with the current row count on `checkpoint()` and
+    `close()`. After an interruption, `resume()` trusts the data on disk rather
+    than the header and truncates both files to the rows they have in common.
+
+    Args:
+        path: The `.npy` file.
+        index_path: JSONL file with one id per row.
+        dim: Embedding dimension, `None` to take it from the first row written.
+    """
+
+    def __init__(self, path: Path, index_path: Path, dim: int | None = None):
+        self.path = path
+        self.index_path = index_path
+        self.dim = dim
+        self.rows = 0
+        self.last_id: dict | None = None
+        self._data = None
+        self._index = None
+
+    @classmethod
+    def resume(cls, path: Path, index_path: Path) -> "NpyWriter":
+        """
+        Reopens existing output for appending, returning a fresh writer if
+        there is nothing to resume.
+        """
+        if not path.exists() or not index_path.exists():
+            return cls(path, index_path)
+
+        _, dim = read_npy_shape(path)
+        data_rows = (path.stat().st_size - NPY_HEADER_SIZE) // (dim * 4)
+
+        writer = cls(path, index_path, dim)
+        index_rows = 0
+        index_bytes = 0
+        last_line = None
+        with index_path.open("rb") as file:
+            for line in file:
+                if not line.endswith(b"\n") or index_rows == data_rows:
+                    break
+                index_rows += 1
+                index_bytes += len(line)
+                last_line = line
+
+        writer.rows = index_rows
+        writer.last_id = json.loads(last_line) if last_line else None
+        writer._open("r+b", "r+b")
+        writer._data.truncate(NPY_HEADER_SIZE + index_rows * dim * 4)
+        writer._index.truncate(index_bytes)
+        writer._data.seek(0, os.SEEK_END)
+        writer._index.seek(0, os.SEEK_END)
+        writer.checkpoint()
+        return writer
+
+    def _open(self, data_mode: str, index_mode: str):
+        self._data = self.path.open(data_mode)
+        self._index = self.index_path.open(index_mode)
+
+    def append(self, ids: list[dict], vectors: list[list[float]]):
+        if self.dim is None:
+            self.dim = len(vectors[0])
+        if self._data is None:
+            self._open("w+b", "wb")
+            self._data.write(_npy_header(0, self.dim))
+
+        values = array.array("f")
+        for vector in vectors:
+            if len(vector) != self.dim:
+                raise OllamaManagerError(
+                    f"Embedding dimension changed from {self.dim} to {len(vector)}"
+                )
+            values.extend(vector)
+        if sys.byteorder == "big":
+            values.byteswap()
+
+        self._data.write(values.tobytes())
+        self._data.flush()
+        self._index.write(b"".join(json.dumps(i).encode() + b"\n" for i in ids))
+        self._index.flush()
+        self.rows += len(vectors)
+
+    def checkpoint(self):
+        if self._data is None:
+            return
+        position = self._data.tell()
+        self._data.seek(0)
+        self._data.write(_npy_header(self.rows, self.dim))
+        self._data.seek(position)
+        self._data.flush()
+
+    def close(self):
+        if self._data is None:
+            return
+        self.checkpoint()
+        self._data.close()
+        self._index.close()
+        self._data = self._index = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -0,0 +1,25 @@
+"""Exceptions raised by Ollama Manager"""
+
+
+class OllamaManagerError(Exception):
+    """
+    Base class for all errors raised by Ollama Manager.
+
+    The message is meant to be shown to the user as-is.
+    """
+
+
+class RequestError(OllamaManagerError):
+    """
+    A remote HTTP request failed after exhausting its retries.
+    """
+
+    def __init__(self, message: str, status_code: int | None = None):
+        super().__init__(message)
+        self.status_code = status_code
+
+
+class OllamaConnectionError(OllamaManagerError):
+    """
+    The local Ollama daemon could not be reached.
+    """
@@ -0,0 +1,186 @@
+"""
+Cached snapshot of the models on the local Ollama daemon.
+
+Records are rebuilt only for models whose digest or modified date changed
+since the previous refresh, and sorted orders are reused until the snapshot
+changes, so repeated listings from long running processes stay cheap.
+
+The shared snapshot asks the daemon again on every query unless
+`OLM_INVENTORY_MAX_AGE` (seconds) is set, queries can also pass `max_age`.
+"""
+
+import datetime
+import fnmatch
+import os
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Literal
+
+import ollama
+from ollama._types import ListResponse
+
+from ollama_manager.utils import convert_bytes, fetch_models
+from ollama_manager.utils.profiling import span
+
+SortKey = Literal["name", "date", "size"]
+SortOrder = Literal["asc", "desc"]
+
+DEFAULT_MAX_AGE = float(os.environ.get("OLM_INVENTORY_MAX_AGE", 0))
+
+
+@dataclass(slots=True, frozen=True)
+class LocalModel:
+    """A model available on the local Ollama daemon."""
+
+    name: str
+    size: int
+    digest: str
+    modified_at: datetime.datetime | None
+    family: str | None = None
+    parameter_size: str | None = None
+    quantization_level: str | None = None
+    # Precomputed sort and display keys
+    name_key: str = field(default="", repr=False, compare=False)
+    modified_ts: float = field(default=0.0, repr=False, compare=False)
+    size_label: str = field(default="", repr=False, compare=False)
+
+    @classmethod
+    def from_ollama(cls, model: ListResponse.Model) -> "LocalModel":
+        details = model.details
+        size = model.size or 0
+        return cls(
+            name=model.model,
+            size=size,
+            digest=model.digest or "",
+            modified_at=model.modified_at,
+            family=details.family if details else None,
+            parameter_size=details.parameter_size if details else None,
+            quantization_level=details.quantization_level if details else None,
+            name_key=model.model.casefold(),
+            modified_ts=model.modified_at.timestamp() if model.modified_at else 0.0,
+            size_label=convert_bytes(size),
+        )
+
+
+_SORT_KEYS = {
+    "name": lambda m: m.name_key,
+    "date": lambda m: m.modified_ts,
+    "size": lambda m: m.size,
+}
+
+
+class Inventory:
+    """
+    Snapshot of local models shared by listing commands and the API.
+
+    Args:
+        max_age: Seconds a snapshot is served without asking the daemon again.
+            `0` checks the daemon on every query.
+    """
+
+    def __init__(self, max_age: float = 0.0):
+        self.max_age = max_age
+        self._records: dict[str, LocalModel] = {}
+        self._sorted: dict[str, list[LocalModel]] = {}
+        self._fetched_at: float | None = None
+        # Guards swapping in a new snapshot; Streamlit sessions share the
+        # inventory from separate threads and event loops.
+        self._lock = threading.Lock()
+
+    def invalidate(self):
+        """Forces the next query to refresh from the daemon."""
+        self._fetched_at = None
+
+    def is_stale(self, max_age: float | None = None) -> bool:
+        """Whether the snapshot is older than `max_age`, defaults to `self.max_age`."""
+        if max_age is None:
+            max_age = self.max_age
+        return (
+            self._fetched_at is None or time.monotonic() - self._fetched_at >= max_age
+        )
+
+    async def refresh(self, client: ollama.AsyncClient | None = None) -> bool:
+        """
+        Fetches the model list from the daemon, reusing unchanged records.
+
+        Returns:
+            Whether the snapshot changed.
+        """
+        raw_models = await fetch_models(client)
+
+        with self._lock, span("inventory.refresh", models=len(raw_models)):
+            records = {}
+            changed = len(raw_models) != len(self._records)
+            for model in raw_models:
+                record = self._records.get(model.model)
+                if (
+                    record is None
+                    or record.digest != model.digest
+                    or record.modified_at != model.modified_at
+                ):
+                    record = LocalModel.from_ollama(model)
+                    changed = True
+                records[record.name] = record
+
+            if changed:
+                self._records = records
+                self._sorted.clear()
+            self._fetched_at = time.monotonic()
+
+        return changed
+
+    def _ordered(self, sort: SortKey) -> list[LocalModel]:
+        with self._lock:
+            ordered = self._sorted.get(sort)
+            if ordered is None:
+                ordered = sorted(self._records.values(), key=_SORT_KEYS[sort])
+                self._sorted[sort] = ordered
+            return ordered
+
+    async def query(
+        self,
+        sort: SortKey = "name",
+        order: SortOrder = "asc",
+        filter: str | None = None,
+        limit: int | None = None,
+        offset: int = 0,
+        client: ollama.AsyncClient | None = None,
+        max_age: float | None = None,
+    ) -> tuple[list[LocalModel], int]:
+        """
+        Lists models from the snapshot, refreshing it when stale.
+
+        Args:
+            sort: Sort by model `name`, modified `date` or `size`.
+            order: `asc` or `desc`.
+            filter: Case-insensitive substring, or glob when it contains `*?[`.
+            limit: Maximum number of models to return.
+            offset: Number of matching models to skip.
+            client: Ollama client to use for refreshing.
+            max_age: Seconds a snapshot may be served without refreshing,
+                defaults to `self.max_age`.
+
+        Returns:
+            The requested page of models and the total number of matches.
+        """
+        if self.is_stale(max_age):
+            await self.refresh(client)
+
+        models = self._ordered(sort)
+        if order == "desc":
+            models = models[::-1]
+
+        if filter:
+            pattern = filter.casefold()
+            if any(char in pattern for char in "*?["):
+                models = [m for m in models if fnmatch.fnmatchcase(m.name_key, pattern)]
+            else:
+                models = [m for m in models if pattern in m.name_key]
+
+        total = len(models)
+        end = None if limit is None else offset + limit
+        return models[offset:end], total
+
+
+inventory = Inventory(max_age=DEFAULT_MAX_AGE)
@@ -0,0 +1,106 @@
+"""
+Remote manifest lookups for checking local models against their registry.
+
+Manifests are fetched with `If-None-Match` and the returned ETag is cached on
+disk, so unchanged models cost a `304 Not Modified` round trip.
+"""
+
+import hashlib
+import json
+import threading
+from pathlib import Path
+
+import httpx
+
+from ollama_manager.utils import get_cache_dir
+from ollama_manager.utils.clients import make_request
+
+DEFAULT_REGISTRY = "registry.ollama.ai"
+DEFAULT_NAMESPACE = "library"
+DEFAULT_TAG = "latest"
+MANIFEST_ACCEPT = "application/vnd.docker.distribution.manifest.v2+json"
+
+
+def manifest_url(model: str) -> str:
+    """
+    Builds the registry manifest URL of a model name.
+
+    `llama3.2` -> https://registry.ollama.ai/v2/library/llama3.2/manifests/latest
+    `hf.co/bartowski/Llama-3.2-1B-Instruct-GGUF:Q4_K_M`
+        -> https://hf.co/v2/bartowski/Llama-3.2-1B-Instruct-GGUF/manifests/Q4_K_M
+    """
+    name, tag = model, DEFAULT_TAG
+    # The tag separator is the last ":" after the host (which may carry a port)
+    colon = model.rfind(":")
+    if colon > model.rfind("/"):
+        name, tag = model[:colon], model[colon + 1 :]
+
+    parts = name.split("/")
+    registry = DEFAULT_REGISTRY
+    if len(parts) > 1 and ("." in parts[0] or ":" in parts[0]):
+        registry = parts.pop(0)
+
+    if len(parts) == 1:
+        parts.insert(0, DEFAULT_NAMESPACE)
+
+    return f"https://{registry}/v2/{'/'.join(parts)}/manifests/{tag}"
+
+
+class ManifestCache:
+    """
+    On-disk map of manifest URL to its last ETag and digest.
+    """
+
+    def __init__(self, path: Path | None = None):
+        self.path = path or get_cache_dir() / "manifests.json"
+        self._lock = threading.Lock()
+        try:
+            self._entries: dict[str, dict[str, str]] = json.loads(self.path.read_text())
+        except (OSError, ValueError):
+            self._entries = {}
+
+    def get(self, url: str) -> dict[str, str] | None:
+        return self._entries.get(url)
+
+    def set(self, url: str, etag: str, digest: str):
+        with self._lock:
+            self._entries[url] = {"etag": etag, "digest": digest}
+
+    def save(self):
+        with self._lock:
+            tmp_path = self.path.with_suffix(".tmp")
+            tmp_path.write_text(json.dumps(self._entries))
+            tmp_path.replace(self.path)
+
+
+async def fetch_manifest_digest(
+    client: httpx.AsyncClient, model: str, cache: ManifestCache | None = None
+) -> str:
+    """
+    Fetches the sha256 digest (hex, without prefix) of a model's remote manifest.
+
+    This matches the `digest` Ollama reports for the local copy of the model.
+
+    Raises:
+        RequestError: When the manifest cannot be fetched.
+    """
+    url = manifest_url(model)
+    cached = cache.get(url) if cache else None
+
+    headers = {"Accept": MANIFEST_ACCEPT}
+    if cached:
+        headers["If-None-Match"] = cached["etag"]
+
+    response = await make_request(client, url, headers=headers)
+    if response.status_code == 304 and cached:
+        return cached["digest"]
+
+    digest = response.headers.get("Docker-Content-Digest", "").removeprefix("sha256:")
+    if not digest:
+        digest = hashlib.sha256(response.content).hexdigest()
+
+    etag = response.headers.get("ETag")
+    if cache and etag:
+        cache.set(url, etag, digest)
+
+    return digest
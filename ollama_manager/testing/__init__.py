@@ -0,0 +1,11 @@
+"""
+Local stand-ins for the Ollama daemon and remote model catalogs.
+
+Used by the benchmarks to measure hot paths without network access or a
+running Ollama.
+"""
+
+from ollama_manager.testing.fake_ollama import FakeOllamaServer
+from ollama_manager.testing.fake_remote import FakeRemoteServer
+
+__all__ = ["FakeOllamaServer", "FakeRemoteServer"]
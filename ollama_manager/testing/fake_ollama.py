@@ -0,0 +1,264 @@
+"""
+Stand-in for the Ollama daemon API.
+
+Implements the endpoints Ollama Manager talks to: tags (list), pull, delete,
+chat, generate, embed and ps. Pulls and generations stream like the real
+daemon, with configurable chunk counts and per-token delays.
+
+>> python -m ollama_manager.testing.fake_ollama --port 11435 --models 200
+>> OLLAMA_HOST=127.0.0.1:11435 olm list
+"""
+
+import argparse
+import datetime
+import hashlib
+import threading
+import time
+
+from ollama_manager.testing.server import FakeHandler, FakeServer
+from ollama_manager.utils import with_default_tag
+
+DEFAULT_REPLY = (
+    "Ollama runs large language models locally. Pick a model, send it a prompt "
+    "and the response is streamed back token by token until generation is done."
+)
+
+
+def make_model(name: str, size: int, days_ago: int = 0) -> dict:
+    modified_at = datetime.datetime.now(datetime.timezone.utc) - datetime.timedelta(
+        days=days_ago
+    )
+    return {
+        "name": name,
+        "model": name,
+        "modified_at": modified_at.isoformat(),
+        "size": size,
+        "digest": hashlib.sha256(name.encode()).hexdigest(),
+        "details": {
+            "format": "gguf",
+            "family": name.split(":")[0],
+            "parameter_size": "7B",
+            "quantization_level": "Q4_K_M",
+        },
+    }
+
+
+class FakeOllamaHandler(FakeHandler):
+    server_version = "FakeOllama/1.0"
+
+    def do_HEAD(self):
+        self.send_body("Ollama is running")
+
+    def do_GET(self):
+        fake: FakeOllamaServer = self.server.fake
+        path = self.path_only
+        if path == "/":
+            self.send_body("Ollama is running", content_type="text/plain")
+        elif path == "/api/tags":
+            with fake.lock:
+                models = list(fake.models.values())
+            self.send_body({"models": models})
+        elif path == "/api/ps":
+            with fake.lock:
+                running = [
+                    fake.models[name] for name in fake.running if name in fake.models
+                ]
+            self.send_body({"models": running})
+        elif path == "/api/version":
+            self.send_body({"version": "0.0.0-fake"})
+        else:
+            self.send_error_json(404, "not found")
+
+    def do_POST(self):
+        path = self.path_only
+        payload = self.read_json()
+        if path == "/api/pull":
+            self.pull(payload)
+        elif path == "/api/chat":
+            self.generate(payload, chat=True)
+        elif path == "/api/generate":
+            self.generate(payload, chat=False)
+        elif path == "/api/embed":
+            self.embed(payload)
+        else:
+            self.send_error_json(404, "not found")
+
+    def do_DELETE(self):
+        fake: FakeOllamaServer = self.server.fake
+        name = self.read_json().get("model") or ""
+        with fake.lock:
+            removed = fake.models.pop(name, None)
+        if removed is None:
+            self.send_error_json(404, f"model '{name}' not found")
+        else:
+            self.send_body(b"", content_type="application/json")
+
+    def pull(self, payload: dict):
+        fake: FakeOllamaServer = self.server.fake
+        name = with_default_tag(payload.get("model") or "")
+
+        total = fake.pull_size
+        chunks = max(fake.pull_chunks, 1)
+
+        def progress():
+            yield {"status": "pulling manifest"}
+            for index in range(1, chunks + 1):
+                time.sleep(fake.pull_delay)
+                yield {
+                    "status": "pulling layer",
+                    "digest": "sha256:" + hashlib.sha256(name.encode()).hexdigest(),
+                    "total": total,
+                    "completed": total * index // chunks,
+                }
+            yield {"status": "verifying sha256 digest"}
+            yield {"status": "writing manifest"}
+            with fake.lock:
+                fake.models[name] = make_model(name, total)
+            yield {"status": "success"}
+
+        self.send_stream(progress())
+
+    def generate(self, payload: dict, chat: bool):
+        fake: FakeOllamaServer = self.server.fake
+        model = payload.get("model") or ""
+        with fake.lock:
+            known = model in fake.models
+            fake.running.add(model)
+        if not known:
+            self.send_error_json(404, f"model '{model}' not found")
+            return
+
+        tokens = fake.reply.split(" ")
+        started = time.perf_counter_ns()
+
+        def message(content: str, done: bool) -> dict:
+            created_at = datetime.datetime.now(datetime.timezone.utc).isoformat()
+            body = {"model": model, "created_at": created_at, "done": done}
+            if chat:
+                body["message"] = {"role": "assistant", "content": content}
+            else:
+                body["response"] = content
+            return body
+
+        def final(content: str) -> dict:
+            elapsed = time.perf_counter_ns() - started
+            body = message(content, True)
+            body.update(
+                {
+                    "done_reason": "stop",
+                    "total_duration": elapsed,
+                    "load_duration": 0,
+                    "prompt_eval_count": len(payload.get("messages") or [1]),
+                    "prompt_eval_duration": 0,
+                    "eval_count": len(tokens),
+                    "eval_duration": elapsed,
+                }
+            )
+            return body
+
+        def stream():
+            for index, token in enumerate(tokens):
+                time.sleep(fake.token_delay)
+                yield message(token if index == 0 else f" {token}", False)
+            yield final("")
+
+        if payload.get("stream", True):
+            self.send_stream(stream())
+        else:
+            time.sleep(fake.token_delay * len(tokens))
+            self.send_body(final(fake.reply))
+
+    def embed(self, payload: dict):
+        fake: FakeOllamaServer = self.server.fake
+        model = payload.get("model") or ""
+        with fake.lock:
+            known = model in fake.models
+        if not known:
+            self.send_error_json(404, f"model '{model}' not found")
+            return
+
+        inputs = payload.get("input") or []
+        if isinstance(inputs, str):
+            inputs = [inputs]
+
+        embeddings = []
+        for text in inputs:
+            seed = hashlib.sha256(text.encode()).digest()
+            embeddings.append(
+                [seed[i % len(seed)] / 255 for i in range(fake.embedding_size)]
+            )
+        time.sleep(fake.token_delay * len(inputs))
+        self.send_body({"model": model, "embeddings": embeddings})
+
+
+class FakeOllamaServer(FakeServer):
+    """
+    Fake Ollama daemon, point clients at it with `OLLAMA_HOST=server.address`.
+
+    Args:
+        models: Number of synthetic models to start with, or a list of names.
+        pull_size: Total bytes reported by pulls.
+        pull_chunks: Number of progress updates per pull.
+        pull_delay: Seconds between pull progress updates.
+        token_delay: Seconds between generated tokens (and per embed input).
+        reply: Text returned by chat and generate.
+        embedding_size: Dimension of returned embeddings.
+    """
+
+    handler = FakeOllamaHandler
+
+    def __init__(
+        self,
+        models: int | list[str] = 20,
+        pull_size: int = 2 * 1024**3,
+        pull_chunks: int = 100,
+        pull_delay: float = 0.0,
+        token_delay: float = 0.0,
+        reply: str = DEFAULT_REPLY,
+        embedding_size: int = 768,
+        **kwargs,
+    ):
+        super().__init__(**kwargs)
+        names = (
+            [f"model-{index:04d}:latest" for index in range(models)]
+            if isinstance(models, int)
+            else models
+        )
+        self.models = {
+            name: make_model(name, (index % 50 + 1) * 100 * 1024**2, index % 400)
+            for index, name in enumerate(names)
+        }
+        self.running: set[str] = set()
+        self.lock = threading.Lock()
+        self.pull_size = pull_size
+        self.pull_chunks = pull_chunks
+        self.pull_delay = pull_delay
+        self.token_delay = token_delay
+        self.reply = reply
+        self.embedding_size = embedding_size
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=11435)
+    parser.add_argument("--models", type=int, default=20)
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--bandwidth", type=float, default=None)
+    parser.add_argument("--token-delay", type=float, default=0.0)
+    parser.add_argument("--pull-delay", type=float, default=0.0)
+    args = parser.parse_args()
+
+    FakeOllamaServer(
+        models=args.models,
+        token_delay=args.token_delay,
+        pull_delay=args.pull_delay,
+        latency=args.latency,
+        bandwidth=args.bandwidth,
+        host=args.host,
+        port=args.port,
+    ).serve_forever()
+
+
+if __name__ == "__main__":
+    main()
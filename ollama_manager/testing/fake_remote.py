@@ -0,0 +1,105 @@
+"""
+Stand-in for ollama.com and the Hugging Face models API serving recorded fixtures.
+
+Fixture layout (see `benchmarks/fixtures`):
+
+    ollama/search.html                  -> GET /search
+    ollama/tags/{model}.html            -> GET /library/{model}/tags
+    hugging_face/{owner}__{repo}.json   -> GET /api/models/{owner}/{repo}
+                                           GET /api/models?search=...&limit=...
+
+>> python -m ollama_manager.testing.fake_remote benchmarks/fixtures --port 8765
+>> OLM_OLLAMA_URL=http://127.0.0.1:8765 OLM_HUGGING_FACE_URL=http://127.0.0.1:8765 olm pull
+"""
+
+import argparse
+import json
+from pathlib import Path
+
+from ollama_manager.testing.server import FakeHandler, FakeServer
+
+
+class FakeRemoteHandler(FakeHandler):
+    server_version = "FakeRemote/1.0"
+
+    def do_GET(self):
+        fake: FakeRemoteServer = self.server.fake
+        path = self.path_only.strip("/")
+        parts = path.split("/")
+
+        if path == "search":
+            self.send_fixture(fake.fixtures_dir / "ollama" / "search.html")
+        elif len(parts) == 3 and parts[0] == "library" and parts[2] == "tags":
+            self.send_fixture(
+                fake.fixtures_dir / "ollama" / "tags" / f"{parts[1]}.html"
+            )
+        elif path == "api/models":
+            self.send_body(fake.search_hugging_face(self.query))
+        elif len(parts) == 4 and parts[:2] == ["api", "models"]:
+            self.send_fixture(
+                fake.fixtures_dir / "hugging_face" / f"{parts[2]}__{parts[3]}.json",
+                content_type="application/json",
+            )
+        else:
+            self.send_error_json(404, "not found")
+
+    def send_fixture(self, path: Path, content_type: str | None = None):
+        body = self.server.fake.read_fixture(path)
+        if body is None:
+            self.send_error_json(404, "not found")
+        else:
+            self.send_body(body, content_type=content_type)
+
+
+class FakeRemoteServer(FakeServer):
+    """
+    Fake model catalogs, point Ollama Manager at it with `OLM_OLLAMA_URL` and
+    `OLM_HUGGING_FACE_URL` set to `server.url`.
+
+    Args:
+        fixtures_dir: Directory with `ollama/` and `hugging_face/` fixtures.
+    """
+
+    handler = FakeRemoteHandler
+
+    def __init__(self, fixtures_dir: str | Path, **kwargs):
+        super().__init__(**kwargs)
+        self.fixtures_dir = Path(fixtures_dir)
+        self._fixtures: dict[Path, bytes | None] = {}
+
+    def read_fixture(self, path: Path) -> bytes | None:
+        if path not in self._fixtures:
+            self._fixtures[path] = path.read_bytes() if path.is_file() else None
+        return self._fixtures[path]
+
+    def search_hugging_face(self, query: dict[str, str]) -> list[dict]:
+        search = query.get("search", "").lower()
+        limit = int(query.get("limit") or 20)
+        results = []
+        for path in sorted((self.fixtures_dir / "hugging_face").glob("*.json")):
+            model_id = json.loads(self.read_fixture(path))["modelId"]
+            if search in model_id.lower():
+                results.append({"id": model_id, "modelId": model_id})
+        return results[:limit]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("fixtures_dir")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--bandwidth", type=float, default=None)
+    args = parser.parse_args()
+
+    FakeRemoteServer(
+        args.fixtures_dir,
+        latency=args.latency,
+        bandwidth=args.bandwidth,
+        host=args.host,
+        port=args.port,
+    ).serve_forever()
+
+
+if __name__ == "__main__":
+    main()
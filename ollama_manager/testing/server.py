@@ -0,0 +1,160 @@
+"""
+Threaded HTTP server base with configurable latency and bandwidth.
+"""
+
+import json
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Iterable
+from urllib.parse import parse_qs, urlsplit
+
+
+class FakeHandler(BaseHTTPRequestHandler):
+    """
+    Request handler shaping responses with the server's latency and bandwidth.
+    """
+
+    protocol_version = "HTTP/1.1"
+    server: "_Server"
+
+    def log_message(self, format, *args):
+        pass
+
+    @property
+    def path_only(self) -> str:
+        return urlsplit(self.path).path
+
+    @property
+    def query(self) -> dict[str, str]:
+        return {k: v[-1] for k, v in parse_qs(urlsplit(self.path).query).items()}
+
+    def read_json(self) -> dict:
+        length = int(self.headers.get("Content-Length") or 0)
+        if not length:
+            return {}
+        return json.loads(self.rfile.read(length))
+
+    def _write_throttled(self, data: bytes):
+        bandwidth = self.server.fake.bandwidth
+        if not bandwidth:
+            self.wfile.write(data)
+            return
+
+        # Write in ~10ms slices so transfers take len(data) / bandwidth seconds
+        chunk_size = max(int(bandwidth / 100), 1)
+        for start in range(0, len(data), chunk_size):
+            chunk = data[start : start + chunk_size]
+            self.wfile.write(chunk)
+            time.sleep(len(chunk) / bandwidth)
+
+    def send_body(
+        self,
+        body: bytes | str | dict | list,
+        status: int = 200,
+        content_type: str | None = None,
+        headers: dict[str, str] | None = None,
+    ):
+        if isinstance(body, (dict, list)):
+            body = json.dumps(body)
+            content_type = content_type or "application/json"
+        if isinstance(body, str):
+            body = body.encode()
+
+        time.sleep(self.server.fake.latency)
+        self.send_response(status)
+        self.send_header("Content-Type", content_type or "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.end_headers()
+        if self.command != "HEAD":
+            self._write_throttled(body)
+
+    def send_stream(self, lines: Iterable[dict]):
+        """Streams newline delimited JSON with chunked transfer encoding."""
+        time.sleep(self.server.fake.latency)
+        self.send_response(200)
+        self.send_header("Content-Type", "application/x-ndjson")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+        for line in lines:
+            data = json.dumps(line).encode() + b"\n"
+            self.wfile.write(f"{len(data):x}\r\n".encode())
+            self._write_throttled(data)
+            self.wfile.write(b"\r\n")
+            self.wfile.flush()
+        self.wfile.write(b"0\r\n\r\n")
+
+    def send_error_json(self, status: int, message: str):
+        self.send_body({"error": message}, status=status)
+
+
+class _Server(ThreadingHTTPServer):
+    daemon_threads = True
+    fake: "FakeServer"
+
+    def handle_error(self, request, client_address):
+        # Clients dropping idle keep-alive connections is expected
+        if not isinstance(sys.exc_info()[1], ConnectionError):
+            super().handle_error(request, client_address)
+
+
+class FakeServer:
+    """
+    Runs the `handler` class of a subclass on a background thread.
+
+    Args:
+        latency: Seconds to wait before every response.
+        bandwidth: Maximum response throughput in bytes per second, `None` for
+            unlimited.
+        host: Interface to bind.
+        port: Port to bind, `0` picks a free one.
+    """
+
+    handler: type[FakeHandler]
+
+    def __init__(
+        self,
+        latency: float = 0.0,
+        bandwidth: float | None = None,
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ):
+        self.latency = latency
+        self.bandwidth = bandwidth
+        self._httpd = _Server((host, port), self.handler)
+        self._httpd.fake = self
+        self._thread: threading.Thread | None = None
+
+    @property
+    def address(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"{host}:{port}"
+
+    @property
+    def url(self) -> str:
+        return f"http://{self.address}"
+
+    def start(self) -> "FakeServer":
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def serve_forever(self):
+        print(f"Serving {type(self).__name__} on {self.url}")
+        try:
+            self._httpd.serve_forever()
+        except KeyboardInterrupt:
+            pass
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
@@ -0,0 +1,202 @@
+"""
+Opt-in SQLite cache of chat responses for the Streamlit UIs.
+
+Responses are keyed by the model digest, the sampling options, the message
+history and the content hash of attached images, so a cached reply is only
+served for exactly the same conversation against exactly the same weights.
+Entries are evicted least recently used first once the cache exceeds its
+entry or size limit.
+"""
+
+import functools
+import hashlib
+import json
+import os
+import re
+import asyncio
+import time
+from pathlib import Path
+from typing import Iterable, Iterator
+
+from ollama_manager.inventory import inventory
+from ollama_manager.utils import get_cache_dir
+from ollama_manager.utils.storage import SQLiteStore
+
+# Only options that change the generated text take part in the key
+KEY_OPTIONS = ("temperature", "top_k", "top_p", "num_ctx")
+DEFAULT_MAX_ENTRIES = int(os.environ.get("OLM_RESPONSE_CACHE_ENTRIES", 1000))
+DEFAULT_MAX_BYTES = int(os.environ.get("OLM_RESPONSE_CACHE_MB", 50)) * 1024**2
+
+_TOKEN_PATTERN = re.compile(r"\s*\S+|\s+$")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    model TEXT NOT NULL,
+    response TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    created_at REAL NOT NULL,
+    last_used REAL NOT NULL,
+    hits INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS responses_last_used ON responses (last_used);
+"""
+
+
+@functools.lru_cache(maxsize=256)
+def _file_hash(path: str, mtime_ns: int, size: int) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as file:
+        for block in iter(lambda: file.read(1024 * 1024), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def image_hash(image: str | bytes) -> str:
+    """
+    Content hash of an image given as a file path or raw bytes.
+    """
+    if isinstance(image, bytes):
+        return hashlib.sha256(image).hexdigest()
+    stat = os.stat(image)
+    return _file_hash(image, stat.st_mtime_ns, stat.st_size)
+
+
+def cache_key(digest: str, options: dict | None, messages: Iterable[dict]) -> str:
+    """
+    Builds the cache key of a chat request.
+
+    Args:
+        digest: Digest of the model weights, so re-pulled models miss.
+        options: Sampling options, only `KEY_OPTIONS` are considered.
+        messages: Chat history, images are replaced by their content hash,
+            taken from `image_hashes` when the message already carries them.
+    """
+    options = options or {}
+    payload = {
+        "digest": digest,
+        "options": {k: options[k] for k in KEY_OPTIONS if k in options},
+        "messages": [
+            {
+                "role": message["role"],
+                "content": message["content"],
+                "images": message.get("image_hashes")
+                or [image_hash(image) for image in message.get("images") or []],
+            }
+            for message in messages
+        ],
+    }
+    encoded = json.dumps(payload, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(encoded.encode()).hexdigest()
+
+
+def model_digest(model: str) -> str | None:
+    """
+    Digest of a local model, `None` when it is not installed.
+
+    Raises:
+        OllamaConnectionError: When the daemon cannot be reached.
+    """
+    models, _ = asyncio.run(inventory.query())
+    for local_model in models:
+        if local_model.name == model:
+            return local_model.digest
+    return None
+
+
+def replay(response: str, delay: float = 0.005) -> Iterator[str]:
+    """
+    Yields a cached response a word at a time, like a live stream.
+    """
+    for token in _TOKEN_PATTERN.findall(response):
+        yield token
+        time.sleep(delay)
+
+
+class ResponseCache(SQLiteStore):
+    """
+    LRU cache of chat responses stored in SQLite.
+
+    Args:
+        path: Database file, defaults to `responses.sqlite3` in the cache dir.
+        max_entries: Maximum number of cached responses.
+        max_bytes: Maximum total size of cached responses.
+    """
+
+    def __init__(
+        self,
+        path: Path | None = None,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+    ):
+        super().__init__(path or get_cache_dir() / "responses.sqlite3", SCHEMA)
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+
+    def get(self, key: str) -> str | None:
+        with self._lock, self._db:
+            row = self._db.execute(
+                "SELECT response FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            self._db.execute(
+                "UPDATE responses SET last_used = ?, hits = hits + 1 WHERE key = ?",
+                (time.time(), key),
+            )
+        return row[0]
+
+    def put(self, key: str, model: str, response: str):
+        now = time.time()
+        with self._lock, self._db:
+            self._db.execute(
+                "INSERT OR REPLACE INTO responses "
+                "(key, model, response, size, created_at, last_used) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (key, model, response, len(response.encode()), now, now),
+            )
+            self._evict()
+
+    def _evict(self):
+        self._db.execute(
+            """
+            DELETE FROM responses WHERE key IN (
+                SELECT key FROM (
+                    SELECT
+                        key,
+                        ROW_NUMBER() OVER recent AS position,
+                        SUM(size) OVER recent AS total
+                    FROM responses
+                    WINDOW recent AS (ORDER BY last_used DESC)
+                )
+                WHERE position > ? OR total > ?
+            )
+            """,
+            (self.max_entries, self.max_bytes),
+        )
+
+    def record(self, key: str, model: str, stream: Iterable[str]) -> Iterator[str]:
+        """
+        Passes a response stream through, caching it once it completes.
+
+        A stream that is abandoned part way is not cached.
+        """
+        parts = []
+        for part in stream:
+            parts.append(part)
+            yield part
+        self.put(key, model, "".join(parts))
+
+    def stats(self) -> tuple[int, int, int]:
+        """
+        Returns the number of entries, their total size and total hits.
+        """
+        with self._lock:
+            return self._db.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0), COALESCE(SUM(hits), 0) "
+                "FROM responses"
+            ).fetchone()
+
+    def clear(self):
+        with self._lock, self._db:
+            self._db.execute("DELETE FROM responses")
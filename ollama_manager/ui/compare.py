@@ -0,0 +1,140 @@
+"""
+Streams one conversation through several models for side-by-side comparison.
+
+Each model is streamed on a worker thread (or all of them on one thread, in
+turn, to avoid loading several models into VRAM at once). Workers update a
+`ModelRun` and notify the caller through a queue, so the UI thread only
+redraws the columns that changed.
+"""
+
+import queue
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable, Iterator
+
+import httpx
+import ollama
+
+
+@dataclass(slots=True)
+class ModelRun:
+    """
+    Progress and stats of one model's response.
+
+    Durations are in seconds. `ttft` is measured by the client from the
+    request to the first streamed token, the rest come from the final chunk.
+    """
+
+    model: str
+    content: str = ""
+    ttft: float | None = None
+    load_duration: float | None = None
+    prompt_eval_count: int | None = None
+    eval_count: int | None = None
+    eval_duration: float | None = None
+    total_duration: float | None = None
+    error: str | None = None
+    done: bool = False
+
+    @property
+    def tokens_per_second(self) -> float | None:
+        if not self.eval_count or not self.eval_duration:
+            return None
+        return self.eval_count / self.eval_duration
+
+
+def stream_run(
+    client: ollama.Client,
+    run: ModelRun,
+    messages: list[dict],
+    options: dict | None,
+    notify: Callable[[], None],
+):
+    """
+    Streams `run.model`'s reply into `run`, calling `notify()` on each update.
+    """
+    started = time.perf_counter()
+    try:
+        stream = client.chat(
+            model=run.model, messages=messages, options=options, stream=True
+        )
+        for chunk in stream:
+            if chunk.message.content:
+                if run.ttft is None:
+                    run.ttft = time.perf_counter() - started
+                run.content += chunk.message.content
+            if chunk.done:
+                run.load_duration = (chunk.load_duration or 0) / 1e9
+                run.prompt_eval_count = chunk.prompt_eval_count
+                run.eval_count = chunk.eval_count
+                run.eval_duration = (chunk.eval_duration or 0) / 1e9
+                run.total_duration = (chunk.total_duration or 0) / 1e9
+            notify()
+    except ollama.ResponseError as e:
+        run.error = e.error
+    except (ConnectionError, httpx.HTTPError) as e:
+        run.error = str(e)
+    finally:
+        run.done = True
+        notify()
+
+
+class Comparison:
+    """
+    Streams `messages` through several models at once, or one after another.
+
+    Args:
+        models: Models to compare, one `ModelRun` each in `runs`.
+        messages: Chat history sent to every model.
+        options: Sampling options sent to every model.
+        sequential: Stream one model at a time instead of concurrently.
+        client: Ollama client, shared by the worker threads.
+    """
+
+    def __init__(
+        self,
+        models: list[str],
+        messages: list[dict],
+        options: dict | None = None,
+        sequential: bool = False,
+        client: ollama.Client | None = None,
+    ):
+        self.runs = [ModelRun(model) for model in models]
+        self.messages = messages
+        self.options = options
+        self.sequential = sequential
+        self.client = client or ollama.Client()
+        self._updates: queue.SimpleQueue[int] = queue.SimpleQueue()
+
+    def _worker(self, indices: list[int]):
+        for index in indices:
+            stream_run(
+                self.client,
+                self.runs[index],
+                self.messages,
+                self.options,
+                lambda index=index: self._updates.put(index),
+            )
+
+    def updates(self) -> Iterator[set[int]]:
+        """
+        Starts streaming and yields the indices of runs that changed since
+        the last yield, until every run is done.
+        """
+        indices = list(range(len(self.runs)))
+        groups = [indices] if self.sequential else [[index] for index in indices]
+        for group in groups:
+            threading.Thread(target=self._worker, args=(group,), daemon=True).start()
+
+        finished: set[int] = set()
+        while len(finished) < len(self.runs):
+            changed = {self._updates.get()}
+            # Coalesce whatever else arrived meanwhile into one redraw
+            while True:
+                try:
+                    changed.add(self._updates.get_nowait())
+                except queue.Empty:
+                    break
+            finished.update(index for index in changed if self.runs[index].done)
+            yield changed
@@ -0,0 +1,117 @@
+import sys
+
+import streamlit as st
+
+from ollama_manager.ui.compare import Comparison, ModelRun
+from ollama_manager.ui.components import sampling_controls, sampling_options
+from ollama_manager.utils import list_models
+
+st.set_page_config(page_title="Compare: Ollama Manager", layout="wide")
+
+# Earlier comparisons kept on screen above the latest one
+HISTORY_LIMIT = 10
+
+
+def session_init():
+    if "comparisons" not in st.session_state:
+        st.session_state["comparisons"] = []
+
+
+def sidebar():
+    with st.sidebar:
+        models = list_models(only_names=True)
+        st.multiselect(
+            ":material/compare_arrows: **:blue[Models to compare]**",
+            options=models,
+            default=[model for model in sys.argv[1:] if model in models],
+            key="compare_models",
+        )
+        st.toggle(
+            "Run sequentially",
+            key="sequential",
+            help="Stream one model at a time so they are not loaded into VRAM "
+            "together",
+        )
+        st.divider()
+        sampling_controls()
+        st.divider()
+        st.caption("[:zap: Ollama Manager](https://github.com/yankeexe/ollama-manager)")
+        st.caption(
+            "[:bug: Report Issues](https://github.com/yankeexe/ollama-manager/issues)"
+        )
+
+
+def format_stats(run: ModelRun) -> str:
+    if run.error:
+        return f":red[❌ {run.error}]"
+
+    stats = []
+    if run.ttft is not None:
+        stats.append(f"TTFT {run.ttft:.2f}s")
+    if run.tokens_per_second:
+        stats.append(f"{run.tokens_per_second:.1f} tokens/s")
+    if run.load_duration is not None:
+        stats.append(f"load {run.load_duration:.2f}s")
+    if run.eval_count:
+        stats.append(f"{run.eval_count} tokens")
+    return " · ".join(stats) if stats else "Waiting..."
+
+
+def render_runs(runs: list[ModelRun]) -> list[tuple]:
+    """
+    Draws one column per model, returning its content and stats placeholders.
+    """
+    placeholders = []
+    for column, run in zip(st.columns(len(runs)), runs):
+        with column:
+            st.markdown(f"**{run.model}**")
+            stats = st.empty()
+            content = st.empty()
+        placeholders.append((content, stats))
+        update_run(run, content, stats)
+    return placeholders
+
+
+def update_run(run: ModelRun, content, stats):
+    stats.caption(format_stats(run))
+    content.markdown(run.content if run.done else f"{run.content}▌")
+
+
+def run():
+    session_init()
+    sidebar()
+    st.header("⚖️ Ollama Manager: Compare Models")
+
+    for comparison in st.session_state["comparisons"][-HISTORY_LIMIT:]:
+        st.chat_message("human").write(comparison["prompt"])
+        render_runs(comparison["runs"])
+        st.divider()
+
+    models = st.session_state["compare_models"]
+    if not models:
+        st.info("Select models to compare in the sidebar.")
+
+    prompt = st.chat_input(
+        placeholder="Send a prompt to every selected model...",
+        disabled=not models,
+    )
+    if prompt:
+        st.chat_message("human").write(prompt)
+        comparison = Comparison(
+            models,
+            [{"role": "user", "content": prompt}],
+            options=sampling_options(),
+            sequential=st.session_state["sequential"],
+        )
+        placeholders = render_runs(comparison.runs)
+        for changed in comparison.updates():
+            for index in changed:
+                update_run(comparison.runs[index], *placeholders[index])
+
+        st.session_state["comparisons"].append(
+            {"prompt": prompt, "runs": comparison.runs}
+        )
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,270 @@
+"""
+Streamlit widgets shared by the chat UIs.
+"""
+
+from typing import Callable, Iterator
+
+import streamlit as st
+
+from ollama_manager.ui.cache import ResponseCache, cache_key, model_digest, replay
+from ollama_manager.ui.sessions import SessionStore
+from ollama_manager.utils import format_bytes, list_models
+
+GREETING = {"role": "assistant", "content": "Hello, how can I help you?"}
+# Messages always rendered at the end of the chat, older ones are paged in
+LIVE_MESSAGES = 20
+PAGE_SIZE = 50
+
+
+@st.cache_resource
+def get_response_cache() -> ResponseCache:
+    return ResponseCache()
+
+
+@st.cache_resource
+def get_session_store() -> SessionStore:
+    return SessionStore()
+
+
+@st.cache_data(ttl=60, show_spinner=False)
+def get_model_digest(model: str) -> str | None:
+    return model_digest(model)
+
+
+def sampling_controls():
+    """
+    Sidebar sliders for the sampling options read by `sampling_options`.
+    """
+    st.slider(label="top_p", value=1.0, min_value=0.0, max_value=1.0, key="top_p")
+    st.slider(label="top_k", value=60.0, min_value=0.0, max_value=100.0, key="top_k")
+    st.slider(
+        label="temperature",
+        value=0.7,
+        min_value=0.0,
+        max_value=1.0,
+        key="temperature",
+    )
+    st.slider(
+        label="Context Length",
+        min_value=1000,
+        max_value=9999,
+        key="context_length",
+        value=4000,
+    )
+
+
+def sampling_options() -> dict:
+    return {
+        "temperature": st.session_state["temperature"],
+        "top_k": st.session_state["top_k"],
+        "top_p": st.session_state["top_p"],
+        "num_ctx": st.session_state["context_length"],
+    }
+
+
+def cache_controls():
+    """
+    Sidebar toggles for the response cache, off unless the user opts in.
+    """
+    st.toggle(
+        ":material/bolt: **Cache responses**",
+        key="cache_enabled",
+        help="Serve repeated prompts from a local cache instead of generating",
+    )
+    if not st.session_state["cache_enabled"]:
+        return
+
+    st.toggle(
+        "Bypass cache",
+        key="cache_bypass",
+        help="Always generate, replacing the cached response",
+    )
+    cache = get_response_cache()
+    entries, size, hits = cache.stats()
+    st.caption(f"{entries} cached responses ({format_bytes(size)}), {hits} hits")
+    if st.button("Clear cache", disabled=not entries):
+        cache.clear()
+        st.rerun()
+
+
+def cache_hit_marker():
+    st.caption(":material/bolt: Served from cache")
+
+
+def cached_response(
+    model: str,
+    options: dict | None,
+    messages: list[dict],
+    generate: Callable[[], Iterator[str]],
+) -> tuple[Iterator[str], bool]:
+    """
+    Streams a response from the cache when enabled, else from `generate`.
+
+    Returns:
+        The response stream and whether it is served from the cache.
+    """
+    if not st.session_state.get("cache_enabled"):
+        return generate(), False
+
+    digest = get_model_digest(model)
+    if digest is None:
+        return generate(), False
+
+    cache = get_response_cache()
+    key = cache_key(digest, options, messages)
+    if not st.session_state.get("cache_bypass"):
+        cached = cache.get(key)
+        if cached is not None:
+            return replay(cached), True
+
+    return cache.record(key, model, generate()), False
+
+
+def chat_state_init():
+    if "messages" not in st.session_state:
+        st.session_state["messages"] = [dict(GREETING)]
+
+    if "session_id" not in st.session_state:
+        st.session_state["session_id"] = None
+        st.session_state["persisted"] = 0
+        st.session_state["history_offset"] = 0
+        st.session_state["history_pages"] = 0
+
+
+def new_session():
+    st.session_state["messages"] = [dict(GREETING)]
+    st.session_state["session_id"] = None
+    st.session_state["persisted"] = 0
+    st.session_state["history_offset"] = 0
+    st.session_state["history_pages"] = 0
+
+
+def load_session(session_id: int):
+    """
+    Resumes a stored session, loading only the messages rendered at first.
+
+    `history_offset` counts the older messages left in the store, they are
+    loaded by `load_earlier_messages` when paged in or sent to the model.
+    """
+    store = get_session_store()
+    session = store.get(session_id)
+    if session is None:
+        return new_session()
+
+    offset = max(session.message_count - LIVE_MESSAGES, 0)
+    st.session_state["messages"] = store.messages(session_id, offset=offset)
+    st.session_state["session_id"] = session_id
+    st.session_state["persisted"] = session.message_count
+    st.session_state["history_offset"] = offset
+    st.session_state["history_pages"] = 0
+    if session.model in list_models(only_names=True):
+        st.session_state["selected_model"] = session.model
+
+
+def load_earlier_messages(count: int | None = None):
+    """
+    Prepends up to `count` stored messages not loaded yet, all when `None`.
+    """
+    offset = st.session_state["history_offset"]
+    if not offset:
+        return
+
+    start = 0 if count is None else max(offset - count, 0)
+    older = get_session_store().messages(
+        st.session_state["session_id"], offset=start, limit=offset - start
+    )
+    st.session_state["messages"] = older + st.session_state["messages"]
+    st.session_state["history_offset"] = start
+
+
+def chat_history() -> list[dict]:
+    """
+    The whole conversation to send to the model, loading what a resumed
+    session still has in the store on the first turn.
+    """
+    load_earlier_messages()
+    return st.session_state["messages"]
+
+
+def delete_session(session_id: int):
+    get_session_store().delete(session_id)
+    new_session()
+
+
+def session_controls(app: str):
+    """
+    Sidebar list of recent sessions of `app` with new and delete actions.
+    """
+    current = st.session_state["session_id"]
+    left, right = st.columns(2)
+    left.button(
+        ":material/add: New chat", on_click=new_session, use_container_width=True
+    )
+    right.button(
+        ":material/delete: Delete",
+        on_click=delete_session,
+        args=(current,),
+        disabled=current is None,
+        use_container_width=True,
+    )
+
+    for session in get_session_store().recent(app):
+        st.button(
+            session.title or "Untitled",
+            key=f"session-{session.id}",
+            help=f"{session.model}, {session.message_count} messages",
+            on_click=load_session,
+            args=(session.id,),
+            type="primary" if session.id == current else "secondary",
+            use_container_width=True,
+        )
+
+
+def persist_messages(app: str, model: str):
+    """
+    Appends the messages added since the last call to the current session,
+    starting a session on the first turn.
+    """
+    messages = st.session_state["messages"]
+    offset = st.session_state["history_offset"]
+    # Stored messages that are loaded, older ones may still be in the store
+    persisted = st.session_state["persisted"] - offset
+    if persisted >= len(messages):
+        return
+
+    store = get_session_store()
+    if st.session_state["session_id"] is None:
+        st.session_state["session_id"] = store.create(app, model)
+    store.append(st.session_state["session_id"], messages[persisted:], model=model)
+    st.session_state["persisted"] = offset + len(messages)
+
+
+def show_earlier_messages():
+    st.session_state["history_pages"] += 1
+    load_earlier_messages(PAGE_SIZE)
+
+
+def render_history():
+    """
+    Renders the tail of the chat, with older messages paged in on request so
+    reruns cost the same however long the conversation gets.
+    """
+    messages = st.session_state["messages"]
+    visible = LIVE_MESSAGES + st.session_state["history_pages"] * PAGE_SIZE
+    start = max(len(messages) - visible, 0)
+    hidden = start + st.session_state["history_offset"]
+    if hidden:
+        st.button(
+            f":material/history: Show {min(hidden, PAGE_SIZE)} earlier messages "
+            f"({hidden} hidden)",
+            on_click=show_earlier_messages,
+        )
+
+    for message in messages[start:]:
+        if message["role"] == "assistant":
+            with st.chat_message("assistant"):
+                st.write(message["content"])
+                if message.get("cached"):
+                    cache_hit_marker()
+        elif message["role"] == "user":
+            st.chat_message("human").write(message["content"])
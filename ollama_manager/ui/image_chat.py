@@ -6,6 +6,16 @@ import ollama
 import streamlit as st
 from PIL import Image
 
+from ollama_manager.ui.components import (
+    cache_controls,
+    cache_hit_marker,
+    cached_response,
+    chat_history,
+    chat_state_init,
+    persist_messages,
+    render_history,
+    session_controls,
+)
 from ollama_manager.utils import list_models
 
 st.set_page_config(
@@ -14,13 +24,7 @@ st.set_page_config(
 
 
 def session_init():
-    if "messages" not in st.session_state:
-        st.session_state["messages"] = [
-            {
-                "role": "assistant",
-                "content": "Hello, how can I help you?",
-            }
-        ]
+    chat_state_init()
 
     if "selected_model" not in st.session_state:
         st.session_state["selected_model"] = ""
@@ -64,6 +68,10 @@ def sidebar():
 
                 st.session_state.uploaded_image = tmp_file.name
 
+        st.divider()
+        cache_controls()
+        st.divider()
+        session_controls("vision")
         st.divider()
         st.info(
             """
@@ -76,7 +84,7 @@ def sidebar():
 
 
 def call_llm():
-    messages = st.session_state["messages"]
+    messages = chat_history()
     stream = ollama.chat(
         model=st.session_state["selected_model"] or sys.argv[1],
         stream=True,
@@ -90,17 +98,21 @@ def call_llm():
             break
 
 
+def get_response():
+    return cached_response(
+        model=st.session_state["selected_model"] or sys.argv[1],
+        options=None,
+        messages=chat_history(),
+        generate=call_llm,
+    )
+
+
 def run():
     session_init()
     sidebar()
     st.title("🤖 Ollama Manager: Vision Chat")
 
-    for message in st.session_state["messages"]:
-        message_role = message["role"]
-        if message_role == "assistant":
-            st.chat_message("assistant").write(message["content"])
-        if message_role == "user":
-            st.chat_message("human").write(message["content"])
+    render_history()
 
     chat_input = st.chat_input(
         placeholder="Write your message...",
@@ -110,6 +122,7 @@ def run():
         if st.session_state.uploaded_image is None:
             st.warning("Please upload an image first!")
         else:
+            model = st.session_state["selected_model"] or sys.argv[1]
             st.session_state.messages.append(
                 {
                     "role": "user",
@@ -117,16 +130,20 @@ def run():
                     "images": [st.session_state.uploaded_image],
                 }
             )
+            persist_messages("vision", model)
             st.chat_message("human").write(chat_input)
 
             with st.spinner("Running..."):
-                response = call_llm()
+                response, cache_hit = get_response()
                 with st.chat_message("assistant"):
                     ai_msg = st.write_stream(response)
+                    if cache_hit:
+                        cache_hit_marker()
 
                 st.session_state["messages"] += [
-                    {"role": "assistant", "content": ai_msg}
+                    {"role": "assistant", "content": ai_msg, "cached": cache_hit}
                 ]
+                persist_messages("vision", model)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,197 @@
+"""
+SQLite store of chat sessions for the Streamlit UIs.
+
+Messages are appended as each turn happens rather than rewriting the whole
+conversation, and can be read back a page at a time. Images are stored once
+per content hash and returned as bytes, so resumed vision chats do not
+depend on temporary upload files still existing.
+"""
+
+import hashlib
+import json
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+from ollama_manager.utils import get_data_dir
+from ollama_manager.utils.storage import SQLiteStore
+
+TITLE_LENGTH = 60
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS sessions (
+    id INTEGER PRIMARY KEY,
+    app TEXT NOT NULL,
+    model TEXT NOT NULL,
+    title TEXT,
+    created_at REAL NOT NULL,
+    updated_at REAL NOT NULL,
+    message_count INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS sessions_recent ON sessions (app, updated_at);
+CREATE TABLE IF NOT EXISTS messages (
+    session_id INTEGER NOT NULL REFERENCES sessions (id) ON DELETE CASCADE,
+    position INTEGER NOT NULL,
+    role TEXT NOT NULL,
+    content TEXT NOT NULL,
+    images TEXT,
+    cached INTEGER NOT NULL DEFAULT 0,
+    created_at REAL NOT NULL,
+    PRIMARY KEY (session_id, position)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS images (
+    hash TEXT PRIMARY KEY,
+    data BLOB NOT NULL
+) WITHOUT ROWID;
+"""
+
+
+@dataclass(slots=True)
+class Session:
+    id: int
+    app: str
+    model: str
+    title: str | None
+    updated_at: float
+    message_count: int
+
+
+def _read_image(image: str | bytes) -> bytes:
+    if isinstance(image, bytes):
+        return image
+    return Path(image).read_bytes()
+
+
+class SessionStore(SQLiteStore):
+    """
+    Chat sessions and their messages stored in SQLite.
+
+    Args:
+        path: Database file, defaults to `sessions.sqlite3` in the data dir.
+    """
+
+    def __init__(self, path: Path | None = None):
+        super().__init__(path or get_data_dir() / "sessions.sqlite3", SCHEMA)
+
+    def create(self, app: str, model: str) -> int:
+        now = time.time()
+        with self._lock, self._db:
+            cursor = self._db.execute(
+                "INSERT INTO sessions (app, model, created_at, updated_at) "
+                "VALUES (?, ?, ?, ?)",
+                (app, model, now, now),
+            )
+        return cursor.lastrowid
+
+    def append(self, session_id: int, messages: list[dict], model: str | None = None):
+        """
+        Appends messages after the ones already stored for the session.
+
+        A message may carry `images` (paths or bytes) and a `cached` flag.
+        The first user message becomes the session title.
+        """
+        if not messages:
+            return
+
+        now = time.time()
+        with self._lock, self._db:
+            (count, title) = self._db.execute(
+                "SELECT message_count, title FROM sessions WHERE id = ?",
+                (session_id,),
+            ).fetchone()
+            rows = []
+            for position, message in enumerate(messages, start=count):
+                hashes = []
+                for image in message.get("images") or []:
+                    data = _read_image(image)
+                    digest = hashlib.sha256(data).hexdigest()
+                    self._db.execute(
+                        "INSERT OR IGNORE INTO images (hash, data) VALUES (?, ?)",
+                        (digest, data),
+                    )
+                    hashes.append(digest)
+                rows.append(
+                    (
+                        session_id,
+                        position,
+                        message["role"],
+                        message["content"],
+                        json.dumps(hashes) if hashes else None,
+                        bool(message.get("cached")),
+                        now,
+                    )
+                )
+                if title is None and message["role"] == "user":
+                    title = " ".join(message["content"].split())[:TITLE_LENGTH]
+
+            self._db.executemany(
+                "INSERT INTO messages "
+                "(session_id, position, role, content, images, cached, created_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+            self._db.execute(
+                "UPDATE sessions SET message_count = ?, title = ?, updated_at = ?, "
+                "model = COALESCE(?, model) WHERE id = ?",
+                (count + len(rows), title, now, model, session_id),
+            )
+
+    def get(self, session_id: int) -> Session | None:
+        with self._lock:
+            row = self._db.execute(
+                "SELECT id, app, model, title, updated_at, message_count "
+                "FROM sessions WHERE id = ?",
+                (session_id,),
+            ).fetchone()
+        return Session(*row) if row else None
+
+    def recent(self, app: str, limit: int = 20) -> list[Session]:
+        with self._lock:
+            rows = self._db.execute(
+                "SELECT id, app, model, title, updated_at, message_count "
+                "FROM sessions WHERE app = ? ORDER BY updated_at DESC LIMIT ?",
+                (app, limit),
+            ).fetchall()
+        return [Session(*row) for row in rows]
+
+    def messages(self, session_id: int, offset: int = 0, limit: int = -1) -> list[dict]:
+        """
+        Reads messages in order, `limit=-1` reads to the end.
+
+        Images are returned as bytes, with their content hashes in
+        `image_hashes`, and `cached` is only set on cache hits.
+        """
+        with self._lock:
+            rows = self._db.execute(
+                "SELECT role, content, images, cached FROM messages "
+                "WHERE session_id = ? AND position >= ? "
+                "ORDER BY position LIMIT ?",
+                (session_id, offset, limit),
+            ).fetchall()
+            image_data = {}
+            for _, _, images, _ in rows:
+                for digest in json.loads(images) if images else []:
+                    if digest not in image_data:
+                        image_data[digest] = self._db.execute(
+                            "SELECT data FROM images WHERE hash = ?", (digest,)
+                        ).fetchone()[0]
+
+        messages = []
+        for role, content, images, cached in rows:
+            message = {"role": role, "content": content}
+            if images:
+                hashes = json.loads(images)
+                message["images"] = [image_data[digest] for digest in hashes]
+                message["image_hashes"] = hashes
+            if cached:
+                message["cached"] = True
+            messages.append(message)
+        return messages
+
+    def delete(self, session_id: int):
+        with self._lock, self._db:
+            self._db.execute("DELETE FROM sessions WHERE id = ?", (session_id,))
+            self._db.execute(
+                "DELETE FROM images WHERE hash NOT IN ("
+                "SELECT DISTINCT value FROM messages, json_each(messages.images))"
+            )
@@ -3,19 +3,25 @@ import sys
 import ollama
 import streamlit as st
 
+from ollama_manager.ui.components import (
+    cache_controls,
+    cache_hit_marker,
+    cached_response,
+    chat_history,
+    chat_state_init,
+    persist_messages,
+    render_history,
+    sampling_controls,
+    sampling_options,
+    session_controls,
+)
 from ollama_manager.utils import list_models
 
 st.set_page_config(page_title="Chat: Ollama Manager")
 
 
 def session_init():
-    if "messages" not in st.session_state:
-        st.session_state["messages"] = [
-            {
-                "role": "assistant",
-                "content": "Hello, how can I help you?",
-            }
-        ]
+    chat_state_init()
 
     if "selected_model" not in st.session_state:
         st.session_state["selected_model"] = ""
@@ -34,24 +40,11 @@ def sidebar():
             st.session_state["selected_model"] = selected_model
 
         st.divider()
-        st.slider(label="top_p", value=1.0, min_value=0.0, max_value=1.0, key="top_p")
-        st.slider(
-            label="top_k", value=60.0, min_value=0.0, max_value=100.0, key="top_k"
-        )
-        st.slider(
-            label="temperature",
-            value=0.7,
-            min_value=0.0,
-            max_value=1.0,
-            key="temperature",
-        )
-        st.slider(
-            label="Context Length",
-            min_value=1000,
-            max_value=9999,
-            key="context_length",
-            value=4000,
-        )
+        sampling_controls()
+        st.divider()
+        cache_controls()
+        st.divider()
+        session_controls("text")
         st.divider()
         st.caption("[:zap: Ollama Manager](https://github.com/yankeexe/ollama-manager)")
         st.caption(
@@ -60,17 +53,12 @@ def sidebar():
 
 
 def call_llm():
-    messages = st.session_state["messages"]
+    messages = chat_history()
     stream = ollama.chat(
         model=st.session_state["selected_model"] or sys.argv[1],
         stream=True,
         messages=messages,
-        options={
-            "temperature": st.session_state["temperature"],
-            "top_k": st.session_state["top_k"],
-            "top_p": st.session_state["top_p"],
-            "num_ctx": st.session_state["context_length"],
-        },
+        options=sampling_options(),
     )
 
     for chunk in stream:
@@ -80,30 +68,41 @@ def call_llm():
             break
 
 
+def get_response():
+    return cached_response(
+        model=st.session_state["selected_model"] or sys.argv[1],
+        options=sampling_options(),
+        messages=chat_history(),
+        generate=call_llm,
+    )
+
+
 def run():
     session_init()
     sidebar()
     st.header("🦙 Ollama Manager: Chat Application")
 
-    for message in st.session_state["messages"]:
-        message_role = message.get("role")
-        if message_role == "assistant":
-            st.chat_message("assistant").write(message["content"])
-        if message_role == "user":
-            st.chat_message("human").write(message["content"])
+    render_history()
 
     chat_input = st.chat_input(
         placeholder="Write your message...",
     )
 
     if chat_input:
+        model = st.session_state["selected_model"] or sys.argv[1]
         st.session_state["messages"] += [{"role": "user", "content": chat_input}]
+        persist_messages("text", model)
         st.chat_message("human").write(chat_input)
-        response = call_llm()
+        response, cache_hit = get_response()
         with st.chat_message("assistant"):
             ai_msg = st.write_stream(response)
+            if cache_hit:
+                cache_hit_marker()
 
-        st.session_state["messages"] += [{"role": "assistant", "content": ai_msg}]
+        st.session_state["messages"] += [
+            {"role": "assistant", "content": ai_msg, "cached": cache_hit}
+        ]
+        persist_messages("text", model)
 
 
 if __name__ == "__main__":
@@ -1,78 +1,123 @@
+import asyncio
+import functools
+import os
 import sys
+from pathlib import Path
 
+import httpx
 import ollama
-import requests
 from simple_term_menu import TerminalMenu
 from ollama._types import ListResponse
 
 import datetime
 
+from ollama_manager.exceptions import OllamaConnectionError, OllamaManagerError
+from ollama_manager.utils.clients import get_ollama_client
+from ollama_manager.utils.profiling import span
 
-def get_session() -> requests.Session:
-    session = requests.Session()
-    session.headers = {
-        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
-    }
 
-    return session
+async def fetch_models(
+    client: ollama.AsyncClient | None = None,
+) -> list[ListResponse.Model]:
+    """
+    Fetches the models available on the local Ollama daemon.
+
+    Raises:
+        OllamaConnectionError: When the daemon cannot be reached.
+    """
+    client = client or get_ollama_client()
+    try:
+        with span("ollama.list"):
+            raw_models: ListResponse = await client.list()
+    except (ConnectionError, httpx.HTTPError, ollama.ResponseError) as e:
+        raise OllamaConnectionError(
+            "Could not fetch models.\n>>> 🦙Is Ollama running?"
+        ) from e
+
+    return raw_models.models
 
 
 def list_models(only_names: bool = False) -> list[str] | None:
-    model_names = []
+    from ollama_manager.inventory import inventory
 
-    try:
-        raw_models: ListResponse = ollama.list()
-    except Exception:
-        print("❌ Could not fetch models.\n>>> 🦙Is Ollama running?")
-        sys.exit(1)
+    all_models, _ = asyncio.run(inventory.query())
 
-    if not raw_models:
+    if not all_models:
         return None
 
-    all_raw_models = raw_models.models
+    if only_names:
+        return [model.name for model in all_models]
 
-    max_length = max(len(model.model) for model in all_raw_models)
+    max_length = max(len(model.name) for model in all_models)
 
-    for model in all_raw_models:
-        if only_names:
-            model_names.append(model.model)
-            continue
+    return [f"{model.name:<{max_length + 5}}{model.size_label}" for model in all_models]
 
-        model_names.append(
-            f"{model.model:<{max_length + 5}}{convert_bytes(model.size)}"
-        )
 
-    return model_names
+def with_default_tag(model: str) -> str:
+    """
+    Adds the `latest` tag Ollama assumes for untagged names, so `llama3.2` and
+    `hf.co/{repo}` compare equal to `llama3.2:latest` and `hf.co/{repo}:latest`.
+    """
+    if ":" not in model.rpartition("/")[2]:
+        return f"{model}:latest"
+    return model
 
 
-def make_request(
-    session: requests.Session, url: str, timeout: int = 5, params: dict[str, str] = None
-):
-    try:
-        response = session.get(url, timeout=timeout, params=params)
-        response.raise_for_status()
-    except requests.exceptions.RequestException as e:
-        print(f"❌ Failed to make request: {str(e)}")
-        sys.exit(1)
+def get_cache_dir() -> Path:
+    """
+    Directory for Ollama Manager caches, honouring `XDG_CACHE_HOME`.
+    """
+    cache_home = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    cache_dir = Path(cache_home) / "ollama-manager"
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    return cache_dir
+
+
+def get_data_dir() -> Path:
+    """
+    Directory for Ollama Manager data worth keeping, honouring `XDG_DATA_HOME`.
+    """
+    data_home = os.environ.get("XDG_DATA_HOME") or Path.home() / ".local" / "share"
+    data_dir = Path(data_home) / "ollama-manager"
+    data_dir.mkdir(parents=True, exist_ok=True)
+    return data_dir
+
 
-    return response
+def handle_errors(func):
+    """
+    Prints Ollama Manager errors raised by a command and exits non-zero.
+    """
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        try:
+            return func(*args, **kwargs)
+        except OllamaManagerError as e:
+            print(f"❌ {e}")
+            sys.exit(1)
 
+    return wrapper
 
-def humanized_relative_time(datetime_str: str):
+
+def humanized_relative_time(datetime_str: str | datetime.datetime):
     """
     Converts a datetime string in ISO 8601 format to a human-readable relative time.
 
     Args:
-        datetime_str: The datetime string in "YYYY-MM-DDTHH:MM:SS.mmmZ" format.
+        datetime_str: The datetime string in "YYYY-MM-DDTHH:MM:SS.mmmZ" format,
+            or an already parsed timezone-aware datetime.
 
     Returns:
         A human-readable string representing the relative time, or the original
         datetime string if it cannot be parsed.
     """
-    try:
-        dt = datetime.datetime.fromisoformat(datetime_str.replace("Z", "+00:00"))
-    except ValueError:
-        return datetime_str  # Return original if parsing fails
+    if isinstance(datetime_str, datetime.datetime):
+        dt = datetime_str
+    else:
+        try:
+            dt = datetime.datetime.fromisoformat(datetime_str.replace("Z", "+00:00"))
+        except ValueError:
+            return datetime_str  # Return original if parsing fails
 
     now = datetime.datetime.now(tz=datetime.timezone.utc)
     delta = now - dt
@@ -121,6 +166,31 @@ def convert_bytes(bytes_value):
         return f"{gb_value:.2f} GB"
 
 
+def format_bytes(size_bytes: int) -> str:
+    """
+    Formats a size in bytes to a human-readable string with suffix.
+
+    Args:
+        size_bytes: Integer representing size in bytes
+
+    Returns:
+        Formatted size string with appropriate suffix
+    """
+    # Precomputed suffix table with single-pass conversion
+    _SUFFIXES = ("B", "KB", "MB", "GB", "TB", "PB")
+
+    if not size_bytes:
+        return "0B"
+
+    # Bitwise optimization for log2-based scaling
+    magnitude = (size_bytes.bit_length() - 1) // 10
+
+    # Clamp magnitude to prevent index out of bounds
+    magnitude = min(magnitude, len(_SUFFIXES) - 1)
+    scaled_size = size_bytes / (1024**magnitude)
+    return f"{scaled_size:.2f} {_SUFFIXES[magnitude]}"
+
+
 def handle_interaction(
     data: list, multi_select=False, title: str | None = None
 ) -> list[str]:
@@ -137,7 +207,8 @@ def handle_interaction(
             show_search_hint=True,
             title=title,
         )
-        menu_entry_index: tuple | None = terminal_menu.show()
+        with span("menu"):
+            menu_entry_index: tuple | None = terminal_menu.show()
 
         # Check for None value when user presses `esc` or `ctrl + c`
         if menu_entry_index is None:
@@ -0,0 +1,121 @@
+"""
+Shared async clients for remote registries and the local Ollama daemon.
+
+Timeouts and retries can be tuned with the `OLM_HTTP_TIMEOUT` (seconds) and
+`OLM_HTTP_RETRIES` environment variables. `OLM_OLLAMA_URL` and
+`OLM_HUGGING_FACE_URL` point remote lookups at mirrors or local stand-ins.
+"""
+
+import asyncio
+import os
+import random
+
+import httpx
+import ollama
+
+from ollama_manager.exceptions import RequestError
+from ollama_manager.utils.profiling import span
+
+USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
+
+OLLAMA_URL = os.environ.get("OLM_OLLAMA_URL", "https://ollama.com").rstrip("/")
+HUGGING_FACE_URL = os.environ.get(
+    "OLM_HUGGING_FACE_URL", "https://huggingface.co"
+).rstrip("/")
+
+DEFAULT_TIMEOUT = float(os.environ.get("OLM_HTTP_TIMEOUT", 10))
+DEFAULT_RETRIES = int(os.environ.get("OLM_HTTP_RETRIES", 3))
+DEFAULT_LIMITS = httpx.Limits(max_connections=20, max_keepalive_connections=10)
+
+RETRY_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+BACKOFF_BASE = 0.5
+BACKOFF_CAP = 8.0
+
+
+def get_http_client(
+    timeout: float | None = None, limits: httpx.Limits = DEFAULT_LIMITS
+) -> httpx.AsyncClient:
+    """
+    Creates a pooled client for remote registries (ollama.com, huggingface.co).
+
+    Args:
+        timeout: Per-request timeout in seconds, defaults to `OLM_HTTP_TIMEOUT`.
+        limits: Connection pool limits.
+    """
+    return httpx.AsyncClient(
+        headers={"User-Agent": USER_AGENT},
+        timeout=DEFAULT_TIMEOUT if timeout is None else timeout,
+        limits=limits,
+        follow_redirects=True,
+    )
+
+
+def get_ollama_client(
+    host: str | None = None,
+    timeout: float | None = None,
+    limits: httpx.Limits = DEFAULT_LIMITS,
+) -> ollama.AsyncClient:
+    """
+    Creates a pooled client for the local Ollama daemon.
+
+    Args:
+        host: Ollama host, defaults to `OLLAMA_HOST` or the local daemon.
+        timeout: Per-request timeout in seconds, `None` waits indefinitely
+            which is what long running pulls and generations need.
+        limits: Connection pool limits, size them to the request concurrency.
+    """
+    return ollama.AsyncClient(host=host, timeout=timeout, limits=limits)
+
+
+def _backoff(attempt: int, response: httpx.Response | None = None) -> float:
+    """
+    Full-jitter exponential backoff, honouring a numeric `Retry-After` header.
+    """
+    if response is not None:
+        retry_after = response.headers.get("Retry-After", "")
+        if retry_after.isdigit():
+            return min(float(retry_after), BACKOFF_CAP)
+
+    return random.uniform(0, min(BACKOFF_CAP, BACKOFF_BASE * 2**attempt))
+
+
+async def make_request(
+    client: httpx.AsyncClient,
+    url: str,
+    params: dict | None = None,
+    headers: dict[str, str] | None = None,
+    retries: int = DEFAULT_RETRIES,
+) -> httpx.Response:
+    """
+    GET `url` retrying transport errors and transient status codes.
+
+    Raises:
+        RequestError: When the request still fails after `retries` retries.
+    """
+    for attempt in range(retries + 1):
+        response = None
+        try:
+            with span("http.get", url=str(url), attempt=attempt):
+                response = await client.get(url, params=params, headers=headers)
+            if response.status_code not in RETRY_STATUS_CODES:
+                # Only 4xx/5xx fail, `304 Not Modified` answers conditional requests
+                if response.is_error:
+                    response.raise_for_status()
+                return response
+            error = httpx.HTTPStatusError(
+                f"Server error '{response.status_code}' for url '{response.url}'",
+                request=response.request,
+                response=response,
+            )
+        except httpx.HTTPStatusError as e:
+            raise RequestError(
+                f"Failed to make request: {e}", e.response.status_code
+            ) from e
+        except httpx.TransportError as e:
+            error = e
+
+        if attempt < retries:
+            await asyncio.sleep(_backoff(attempt, response))
+
+    status_code = response.status_code if response is not None else None
+    raise RequestError(f"Failed to make request: {error}", status_code) from error
@@ -0,0 +1,68 @@
+import asyncio
+from typing import Any, AsyncIterator, Awaitable, Callable, Iterable, TypeVar
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+async def bounded_map(
+    func: Callable[[T], Awaitable[R]],
+    items: Iterable[T],
+    limit: int,
+    ordered: bool = True,
+) -> AsyncIterator[R]:
+    """
+    Applies `func` to `items` concurrently with at most `limit` calls in flight.
+
+    Items are pulled from the iterable lazily, so memory stays bounded by the
+    window rather than the input size.
+
+    Args:
+        func: Coroutine function applied to each item.
+        items: Any iterable, consumed lazily.
+        limit: Maximum number of unfinished calls. When `ordered`, results
+            waiting for an earlier slow call count towards the window too.
+        ordered: Yield results in input order instead of completion order.
+    """
+    iterator = iter(items)
+    pending: dict[asyncio.Task, int] = {}
+    finished: dict[int, Any] = {}
+    submitted = 0
+    next_index = 0
+    exhausted = False
+
+    def fill():
+        nonlocal submitted, exhausted
+        while not exhausted:
+            in_window = submitted - next_index if ordered else len(pending)
+            if in_window >= limit:
+                return
+            try:
+                item = next(iterator)
+            except StopIteration:
+                exhausted = True
+                return
+            pending[asyncio.ensure_future(func(item))] = submitted
+            submitted += 1
+
+    try:
+        fill()
+        while pending:
+            done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                index = pending.pop(task)
+                if ordered:
+                    finished[index] = task.result()
+                else:
+                    next_index += 1
+                    yield task.result()
+
+            while ordered and next_index in finished:
+                result = finished.pop(next_index)
+                next_index += 1
+                yield result
+
+            fill()
+    finally:
+        for task in pending:
+            task.cancel()
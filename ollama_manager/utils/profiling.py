@@ -0,0 +1,191 @@
+"""
+Lightweight timing spans for attributing latency across commands.
+
+Spans are only recorded once profiling is enabled, either by `olm --profile`
+which prints a phase breakdown, or by the `OLM_TRACE` environment variable:
+
+    OLM_TRACE=spans.jsonl olm list              # Append spans as JSON lines
+    OLM_TRACE=http://localhost:4318 olm list    # Send to an OTLP/HTTP collector
+"""
+
+import contextlib
+import contextvars
+import json
+import os
+import secrets
+import time
+from dataclasses import asdict, dataclass, field
+from typing import Iterator
+
+import httpx
+from rich.console import Console
+from rich.table import Table
+
+TRACE_ENV_VAR = "OLM_TRACE"
+
+
+@dataclass(slots=True)
+class Span:
+    name: str
+    trace_id: str
+    span_id: str
+    parent_id: str | None
+    start_ns: int
+    end_ns: int = 0
+    attributes: dict[str, str | int | float | bool] = field(default_factory=dict)
+
+    @property
+    def duration_ms(self) -> float:
+        return (self.end_ns - self.start_ns) / 1e6
+
+
+class Tracer:
+    """
+    Collects finished spans for the current process.
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self.trace_id = secrets.token_hex(16)
+        self.spans: list[Span] = []
+        self._current: contextvars.ContextVar[Span | None] = contextvars.ContextVar(
+            "olm_current_span", default=None
+        )
+
+    @contextlib.contextmanager
+    def span(self, name: str, **attributes) -> Iterator[Span | None]:
+        if not self.enabled:
+            yield None
+            return
+
+        parent = self._current.get()
+        span = Span(
+            name=name,
+            trace_id=self.trace_id,
+            span_id=secrets.token_hex(8),
+            parent_id=parent.span_id if parent else None,
+            start_ns=time.time_ns(),
+            attributes=attributes,
+        )
+        token = self._current.set(span)
+        try:
+            yield span
+        finally:
+            span.end_ns = time.time_ns()
+            self._current.reset(token)
+            self.spans.append(span)
+
+
+tracer = Tracer()
+span = tracer.span
+
+
+def enable_profiling():
+    tracer.enabled = True
+
+
+def profiling_requested() -> bool:
+    return bool(os.environ.get(TRACE_ENV_VAR))
+
+
+def print_report():
+    """
+    Prints the time spent per span name, relative to the root span.
+    """
+    if not tracer.spans:
+        return
+
+    roots = [s for s in tracer.spans if s.parent_id is None]
+    wall_ms = sum(s.duration_ms for s in roots) or 1.0
+
+    totals: dict[str, list[float]] = {}
+    for s in tracer.spans:
+        totals.setdefault(s.name, []).append(s.duration_ms)
+
+    table = Table(title="Profile")
+    table.add_column("Phase", style="bright_cyan")
+    table.add_column("Calls", justify="right")
+    table.add_column("Total ms", style="bright_yellow", justify="right")
+    table.add_column("Mean ms", justify="right")
+    table.add_column("% of wall", style="bright_green", justify="right")
+
+    for name, durations in sorted(totals.items(), key=lambda item: -sum(item[1])):
+        total = sum(durations)
+        table.add_row(
+            name,
+            str(len(durations)),
+            f"{total:.1f}",
+            f"{total / len(durations):.1f}",
+            f"{total / wall_ms * 100:.1f}",
+        )
+
+    Console(stderr=True).print(table)
+
+
+def _otlp_payload(spans: list[Span]) -> dict:
+    def attribute(key, value):
+        if isinstance(value, bool):
+            return {"key": key, "value": {"boolValue": value}}
+        if isinstance(value, int):
+            return {"key": key, "value": {"intValue": str(value)}}
+        if isinstance(value, float):
+            return {"key": key, "value": {"doubleValue": value}}
+        return {"key": key, "value": {"stringValue": str(value)}}
+
+    return {
+        "resourceSpans": [
+            {
+                "resource": {
+                    "attributes": [attribute("service.name", "ollama-manager")]
+                },
+                "scopeSpans": [
+                    {
+                        "scope": {"name": "ollama_manager"},
+                        "spans": [
+                            {
+                                "traceId": s.trace_id,
+                                "spanId": s.span_id,
+                                "parentSpanId": s.parent_id or "",
+                                "name": s.name,
+                                "kind": 1,
+                                "startTimeUnixNano": str(s.start_ns),
+                                "endTimeUnixNano": str(s.end_ns),
+                                "attributes": [
+                                    attribute(k, v) for k, v in s.attributes.items()
+                                ],
+                            }
+                            for s in spans
+                        ],
+                    }
+                ],
+            }
+        ]
+    }
+
+
+def export_spans(target: str | None = None):
+    """
+    Exports recorded spans to a JSON lines file or an OTLP/HTTP collector.
+
+    Args:
+        target: File path or `http(s)://` collector URL, defaults to `OLM_TRACE`.
+    """
+    target = target or os.environ.get(TRACE_ENV_VAR)
+    if not target or not tracer.spans:
+        return
+
+    if target.startswith(("http://", "https://")):
+        endpoint = target.rstrip("/")
+        if not endpoint.endswith("/v1/traces"):
+            endpoint += "/v1/traces"
+        try:
+            httpx.post(endpoint, json=_otlp_payload(tracer.spans), timeout=5)
+        except httpx.HTTPError as e:
+            print(f"⚠️ Failed exporting spans to {endpoint}: {e}")
+        return
+
+    with open(target, "a") as file:
+        for s in tracer.spans:
+            record = asdict(s)
+            record["duration_ms"] = s.duration_ms
+            file.write(json.dumps(record) + "\n")
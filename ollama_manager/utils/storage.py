@@ -0,0 +1,32 @@
+"""
+SQLite setup shared by the on-disk stores.
+"""
+
+import sqlite3
+import threading
+from pathlib import Path
+
+
+class SQLiteStore:
+    """
+    Base for stores kept in a single SQLite database in WAL mode.
+
+    The connection may be used from any thread since Streamlit reruns scripts
+    on different threads. Stores used that way hold `_lock` around every
+    access to `_db`.
+
+    Args:
+        path: Database file.
+        schema: Script creating the tables, run every time the store opens.
+    """
+
+    def __init__(self, path: Path, schema: str):
+        self.path = path
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA foreign_keys=ON")
+        self._db.executescript(schema)
+
+    def close(self):
+        self._db.close()
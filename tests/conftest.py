@@ -0,0 +1,67 @@
+"""
+Shared fixtures: a fake Ollama daemon and a fake ollama.com / Hugging Face
+catalog serving the recorded fixtures in `benchmarks/fixtures`.
+
+The remote URLs and `OLLAMA_HOST` are read when `ollama_manager` and `ollama`
+are imported, so free ports are picked and exported before importing either.
+"""
+
+import os
+import socket
+from pathlib import Path
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+OLLAMA_PORT = _free_port()
+REMOTE_PORT = _free_port()
+os.environ["OLLAMA_HOST"] = f"127.0.0.1:{OLLAMA_PORT}"
+os.environ["OLM_OLLAMA_URL"] = f"http://127.0.0.1:{REMOTE_PORT}"
+os.environ["OLM_HUGGING_FACE_URL"] = f"http://127.0.0.1:{REMOTE_PORT}"
+
+import pytest  # noqa: E402
+
+from ollama_manager.inventory import inventory  # noqa: E402
+from ollama_manager.testing import FakeOllamaServer, FakeRemoteServer  # noqa: E402
+
+FIXTURES_DIR = Path(__file__).parent.parent / "benchmarks" / "fixtures"
+LOCAL_MODELS = 200
+
+
+@pytest.fixture(scope="session")
+def _ollama_server():
+    with FakeOllamaServer(models=LOCAL_MODELS, port=OLLAMA_PORT) as server:
+        yield server
+
+
+@pytest.fixture
+def ollama_server(_ollama_server):
+    """
+    The fake Ollama daemon, with its models reset for every test.
+    """
+    models = dict(_ollama_server.models)
+    inventory.invalidate()
+    yield _ollama_server
+    with _ollama_server.lock:
+        _ollama_server.models = models
+        _ollama_server.running.clear()
+    inventory.invalidate()
+
+
+@pytest.fixture(scope="session")
+def remote_server():
+    with FakeRemoteServer(FIXTURES_DIR, port=REMOTE_PORT) as server:
+        yield server
+
+
+@pytest.fixture(autouse=True)
+def data_dirs(tmp_path, monkeypatch):
+    """
+    Keeps caches, sessions and the pull queue out of the user's home.
+    """
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    monkeypatch.setenv("XDG_DATA_HOME", str(tmp_path / "data"))
@@ -0,0 +1,131 @@
+import asyncio
+
+import ollama
+import pytest
+from click.testing import CliRunner
+
+from ollama_manager import api
+from ollama_manager.app import cli
+from ollama_manager.exceptions import OllamaConnectionError
+from ollama_manager.utils import fetch_models
+
+
+@pytest.mark.parametrize(
+    ("filename", "expected"),
+    [
+        ("Llama-3.2-1B-Instruct-Q4_K_M.gguf", "Q4_K_M"),
+        ("model-iq4_xs.gguf", "IQ4_XS"),
+        ("Qwen3-UD-Q2_K_XL.gguf", "UD-Q2_K_XL"),
+        ("gemma-3-27b-it-BF16.gguf", "BF16"),
+        # Directory names never shadow the file's own tag
+        ("Q8_0/model-Q4_0.gguf", "Q4_0"),
+        ("README.md", None),
+    ],
+)
+def test_extract_quantization(filename, expected):
+    assert api.extract_quantization(filename) == expected
+
+
+def test_group_quantizations_folds_shards_and_skips_projectors():
+    files = [
+        {"rfilename": "Q4_K_M/model-Q4_K_M-00001-of-00002.gguf", "size": 10},
+        {"rfilename": "Q4_K_M/model-Q4_K_M-00002-of-00002.gguf", "size": 5},
+        {"rfilename": "model-Q8_0.gguf", "size": 20},
+        # A second file of the same quantization is not summed in
+        {"rfilename": "other/model-Q8_0.gguf", "size": 99},
+        {"rfilename": "mmproj-model-F16.gguf", "size": 1},
+        {"rfilename": "README.md", "size": 1},
+        {"rfilename": "model-F16.gguf"},
+    ]
+
+    assert api.group_quantizations(files) == {"Q4_K_M": 15, "Q8_0": 20, "F16": 0}
+
+
+async def _serve_truncated_pull(reader, writer):
+    await reader.readuntil(b"\r\n\r\n")
+    line = b'{"status": "pulling", "completed": 1, "total": 10}\n'
+    writer.write(
+        b"HTTP/1.1 200 OK\r\nContent-Type: application/x-ndjson\r\n"
+        b"Transfer-Encoding: chunked\r\n\r\n"
+        b"%x\r\n%s\r\n" % (len(line), line)
+    )
+    await writer.drain()
+    writer.close()
+
+
+def test_pull_wraps_dropped_streams():
+    async def pull_all():
+        server = await asyncio.start_server(_serve_truncated_pull, "127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        client = ollama.AsyncClient(host=f"http://127.0.0.1:{port}")
+        progress = []
+        async with server:
+            with pytest.raises(OllamaConnectionError):
+                await api.pull("llama3.2", progress=progress.append, client=client)
+            errors = await api.pull_many(["a", "b"], client=client)
+        return progress, errors
+
+    progress, errors = asyncio.run(pull_all())
+
+    assert progress[0].completed == 1
+    assert set(errors) == {"a", "b"}
+
+
+def test_delete_missing_model(ollama_server):
+    with pytest.raises(OllamaConnectionError):
+        asyncio.run(api.delete("missing:latest"))
+
+
+def test_delete_many_reports_each_model(ollama_server):
+    models = ["model-0000:latest", "model-0001:latest"]
+    deleted = []
+
+    asyncio.run(api.delete_many(models, on_deleted=deleted.append))
+
+    assert sorted(deleted) == models
+    assert not set(models) & set(ollama_server.models)
+
+
+async def _drop_connection(reader, writer):
+    await reader.readuntil(b"\r\n\r\n")
+    writer.write(b"HTTP/1.1 200 OK\r\nContent-Length: 100\r\n\r\n{")
+    await writer.drain()
+    writer.close()
+
+
+def test_fetch_models_wraps_dropped_responses():
+    async def fetch():
+        server = await asyncio.start_server(_drop_connection, "127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        async with server:
+            await fetch_models(ollama.AsyncClient(host=f"http://127.0.0.1:{port}"))
+
+    with pytest.raises(OllamaConnectionError):
+        asyncio.run(fetch())
+
+
+def test_list_models_pages_and_filters(ollama_server):
+    models = asyncio.run(
+        api.list_models(sort="name", filter="model-00*", limit=5, offset=5)
+    )
+
+    assert [model.name for model in models] == [
+        f"model-{index:04d}:latest" for index in range(5, 10)
+    ]
+
+
+def test_list_models_max_age_serves_snapshot(ollama_server):
+    assert asyncio.run(api.list_models(max_age=60))
+
+    with ollama_server.lock:
+        ollama_server.models.clear()
+
+    assert asyncio.run(api.list_models(max_age=60))
+    assert asyncio.run(api.list_models()) == []
+
+
+def test_list_rejects_page_past_the_end(ollama_server):
+    result = CliRunner().invoke(cli, ["list", "-l", "150", "-p", "3"])
+
+    assert result.exit_code == 2
+    assert "past the last page (2)" in result.output
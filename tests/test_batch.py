@@ -0,0 +1,107 @@
+import json
+
+import pytest
+from click.testing import CliRunner
+
+from ollama_manager.app import cli
+from ollama_manager.commands.batch import parse_request, read_checkpoint
+
+MODEL = "model-0000:latest"
+
+
+def read_results(path) -> list[dict]:
+    return [json.loads(line) for line in path.read_text().splitlines()]
+
+
+def test_read_checkpoint_truncates_partial_line(tmp_path):
+    output = tmp_path / "out.jsonl"
+    output.write_text('{"index": 0, "response": "a"}\n{"index": 1, "resp')
+
+    assert read_checkpoint(output) == {0}
+    assert output.read_text() == '{"index": 0, "response": "a"}\n'
+
+
+def test_read_checkpoint_drops_failed_rows(tmp_path):
+    output = tmp_path / "out.jsonl"
+    output.write_text(
+        '{"index": 0, "response": "a"}\n'
+        '{"index": 1, "error": "timed out"}\n'
+        '{"index": 2, "response": "c"}\n'
+        '{"index": 3, "resp'
+    )
+
+    assert read_checkpoint(output) == {0, 2}
+    assert [row["index"] for row in read_results(output)] == [0, 2]
+
+
+@pytest.mark.parametrize(
+    ("line", "expected"),
+    [
+        ('"Why is the sky blue?"', {"prompt": "Why is the sky blue?"}),
+        ('{"messages": []}', {"messages": []}),
+    ],
+)
+def test_parse_request(line, expected):
+    assert parse_request(line) == expected
+
+
+INVALID_LINES = [
+    "not json",
+    "[1, 2]",
+    "42",
+    '{"messages": "hi"}',
+    '{"prompt": "c", "options": "x"}',
+    '{"prompt": 5}',
+    '{"messages": [{"content": "x"}]}',
+]
+
+
+@pytest.mark.parametrize("line", INVALID_LINES)
+def test_parse_request_rejects_invalid_lines(line):
+    with pytest.raises(ValueError):
+        parse_request(line)
+
+
+def test_batch_resumes_and_retries_failures(ollama_server, tmp_path):
+    input_file = tmp_path / "prompts.jsonl"
+    lines = [
+        '{"prompt": "a", "id": "first"}',
+        *INVALID_LINES,
+        '{"messages": [{"role": "user", "content": "b"}]}',
+    ]
+    input_file.write_text("\n".join(lines) + "\n")
+    output = tmp_path / "prompts.out.jsonl"
+    runner = CliRunner()
+
+    result = runner.invoke(cli, ["batch", str(input_file), "-m", MODEL])
+
+    assert result.exit_code == 1
+    assert f"{len(INVALID_LINES)} failed" in result.output
+    rows = {row["index"]: row for row in read_results(output)}
+    assert rows[0]["id"] == "first"
+    assert rows[0]["response"] == ollama_server.reply
+    for index in range(1, len(lines) - 1):
+        assert f"line {index + 1}" in rows[index]["error"]
+    assert rows[len(lines) - 1]["response"] == ollama_server.reply
+
+    lines[1 : len(lines) - 1] = ['"fixed"'] * len(INVALID_LINES)
+    input_file.write_text("\n".join(lines) + "\n")
+    result = runner.invoke(cli, ["batch", str(input_file), "-m", MODEL])
+
+    assert result.exit_code == 0, result.output
+    assert "Resuming: 2" in result.output
+    rows = read_results(output)
+    assert sorted(row["index"] for row in rows) == list(range(len(lines)))
+    assert not any("error" in row for row in rows)
+
+
+def test_batch_fails_for_missing_model(ollama_server, tmp_path):
+    input_file = tmp_path / "prompts.jsonl"
+    input_file.write_text('"a"\n"b"\n')
+
+    result = CliRunner().invoke(
+        cli, ["batch", str(input_file), "-m", "missing", "--unordered"]
+    )
+
+    assert result.exit_code == 1
+    assert "2 failed" in result.output
@@ -0,0 +1,91 @@
+"""
+Benchmarks of the hot paths against the fake servers.
+
+Each benchmark fails when its median exceeds a budget several times the
+expected time, catching regressions such as lost connection reuse or
+per-model daemon round trips rather than noise. Compare runs in detail with
+`pytest tests/test_benchmarks.py --benchmark-autosave` and
+`pytest-benchmark compare`.
+"""
+
+import asyncio
+import time
+
+import ollama
+import pytest
+from click.testing import CliRunner
+
+from ollama_manager import api
+from ollama_manager.app import cli
+from ollama_manager.commands import pull
+from ollama_manager.utils.clients import get_http_client
+
+
+def check_budget(benchmark, seconds: float):
+    # Stats are missing when run with --benchmark-disable
+    if benchmark.stats is None:
+        return
+    median = benchmark.stats.stats.median
+    assert median < seconds, f"median {median:.3f}s is over the {seconds}s budget"
+
+
+@pytest.mark.benchmark(group="remote")
+def test_list_remote_model_tags(benchmark, remote_server):
+    async def list_tags():
+        async with get_http_client() as client:
+            return await api.list_tags("qwen3", client=client)
+
+    tags = benchmark(lambda: asyncio.run(list_tags()))
+
+    assert tags
+    check_budget(benchmark, 1.0)
+
+
+@pytest.mark.benchmark(group="remote")
+def test_pull_model_async(benchmark, remote_server, ollama_server, monkeypatch):
+    # Auto-select the first menu entry so the interactive flow can be timed
+    monkeypatch.setattr(pull, "handle_interaction", lambda data, **kwargs: [data[0]])
+
+    benchmark(lambda: asyncio.run(pull.pull_model_async(False, None, 20, False)))
+
+    assert "llama3.2:latest" in ollama_server.models
+    check_budget(benchmark, 1.5)
+
+
+@pytest.mark.benchmark(group="local")
+def test_list_ollama_models(benchmark, ollama_server):
+    runner = CliRunner()
+
+    result = benchmark(lambda: runner.invoke(cli, ["list"]))
+
+    assert result.exit_code == 0, result.output
+    assert "model-0000:latest" in result.output
+    check_budget(benchmark, 1.5)
+
+
+@pytest.mark.benchmark(group="local")
+def test_chat_stream(benchmark, ollama_server):
+    model = next(iter(ollama_server.models))
+    first_token = []
+
+    def chat() -> str:
+        started = time.perf_counter()
+        content = ""
+        stream = ollama.chat(
+            model=model,
+            stream=True,
+            messages=[{"role": "user", "content": "Hello"}],
+        )
+        for chunk in stream:
+            if not content:
+                first_token.append(time.perf_counter() - started)
+            if chunk["done"]:
+                break
+            content += chunk["message"]["content"]
+        return content
+
+    content = benchmark(chat)
+
+    assert content == ollama_server.reply
+    benchmark.extra_info["ttft_ms"] = sorted(first_token)[len(first_token) // 2] * 1000
+    check_budget(benchmark, 0.5)
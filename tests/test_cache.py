@@ -0,0 +1,53 @@
+import hashlib
+import time
+
+from ollama_manager.ui.cache import ResponseCache, cache_key, model_digest
+
+
+def test_cache_key_uses_image_contents_and_sampling_options(tmp_path):
+    first, second = tmp_path / "a.png", tmp_path / "b.png"
+    first.write_bytes(b"same image")
+    second.write_bytes(b"same image")
+
+    def key(image, options):
+        messages = [{"role": "user", "content": "what is this?", "images": [image]}]
+        return cache_key("digest", options, messages)
+
+    assert key(str(first), {}) == key(b"same image", {})
+    # Options that do not change the generated text are ignored
+    assert key(str(first), {}) == key(str(second), {"seed": 1})
+    assert key(str(first), {}) != key(str(first), {"temperature": 0.1})
+
+
+def test_response_cache_evicts_least_recently_used(tmp_path):
+    cache = ResponseCache(tmp_path / "responses.sqlite3", max_entries=2)
+    cache.put("a", "m", "first")
+    time.sleep(0.01)
+    cache.put("b", "m", "second")
+    time.sleep(0.01)
+    assert cache.get("a") == "first"
+
+    cache.put("c", "m", "third")
+
+    assert cache.get("b") is None
+    assert cache.get("a") == "first"
+    assert cache.stats() == (2, len("first") + len("third"), 2)
+
+
+def test_response_cache_only_records_finished_streams(tmp_path):
+    cache = ResponseCache(tmp_path / "responses.sqlite3")
+
+    assert list(cache.record("done", "m", iter(["a ", "b"]))) == ["a ", "b"]
+    abandoned = cache.record("abandoned", "m", iter(["a ", "b"]))
+    next(abandoned)
+    abandoned.close()
+
+    assert cache.get("done") == "a b"
+    assert cache.get("abandoned") is None
+
+
+def test_model_digest_reads_the_inventory(ollama_server):
+    name = "model-0000:latest"
+
+    assert model_digest(name) == hashlib.sha256(name.encode()).hexdigest()
+    assert model_digest("missing:latest") is None
@@ -0,0 +1,83 @@
+import threading
+
+import ollama
+import pytest
+
+from ollama_manager.ui.compare import Comparison
+
+MODELS = ["model-0000:latest", "model-0001:latest", "model-0002:latest"]
+MESSAGES = [{"role": "user", "content": "Why is the sky blue?"}]
+
+
+class CountingClient(ollama.Client):
+    """
+    Records the peak number of chats streaming at once.
+    """
+
+    def __init__(self, host: str):
+        super().__init__(host=host)
+        self.lock = threading.Lock()
+        self.streaming = self.peak = 0
+
+    def chat(self, *args, **kwargs):
+        stream = super().chat(*args, **kwargs)
+
+        def counted():
+            with self.lock:
+                self.streaming += 1
+                self.peak = max(self.peak, self.streaming)
+            try:
+                yield from stream
+            finally:
+                with self.lock:
+                    self.streaming -= 1
+
+        return counted()
+
+
+@pytest.fixture
+def slow_server(ollama_server, monkeypatch):
+    # Slow enough that concurrent streams overlap
+    monkeypatch.setattr(ollama_server, "token_delay", 0.005)
+    return ollama_server
+
+
+def compare(server, models: list[str], sequential: bool = False):
+    client = CountingClient(server.url)
+    comparison = Comparison(models, MESSAGES, sequential=sequential, client=client)
+    updates = list(comparison.updates())
+    return comparison, updates, client
+
+
+def test_runs_follow_model_order_with_stats(slow_server):
+    comparison, updates, client = compare(slow_server, MODELS)
+
+    assert [run.model for run in comparison.runs] == MODELS
+    assert set().union(*updates) == {0, 1, 2}
+    assert client.peak == 3
+    for run in comparison.runs:
+        assert run.done and run.error is None
+        assert run.content == slow_server.reply
+        assert run.ttft > 0 and run.total_duration > 0
+        assert run.eval_count and run.tokens_per_second > 0
+
+
+def test_sequential_streams_one_model_at_a_time(slow_server):
+    client = CountingClient(slow_server.url)
+    comparison = Comparison(MODELS, MESSAGES, sequential=True, client=client)
+
+    for changed in comparison.updates():
+        # A run only reports once every run before it is done
+        for index in changed:
+            assert all(run.done for run in comparison.runs[:index])
+
+    assert client.peak == 1
+    assert all(run.content == slow_server.reply for run in comparison.runs)
+
+
+def test_a_failing_model_does_not_stop_the_others(ollama_server):
+    comparison, _, _ = compare(ollama_server, ["missing:latest", MODELS[0]])
+
+    failed, succeeded = comparison.runs
+    assert failed.done and failed.error and failed.tokens_per_second is None
+    assert succeeded.content == ollama_server.reply
@@ -0,0 +1,86 @@
+import asyncio
+
+import pytest
+
+from ollama_manager.utils.concurrency import bounded_map
+
+
+def run_map(delays: list[float], limit: int, ordered: bool) -> tuple[list, int]:
+    """
+    Maps a sleep over `delays`, returning the results and peak concurrency.
+    """
+    running = peak = 0
+
+    async def work(item: tuple[int, float]) -> int:
+        nonlocal running, peak
+        index, delay = item
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(delay)
+        running -= 1
+        return index
+
+    async def collect():
+        items = enumerate(delays)
+        return [r async for r in bounded_map(work, items, limit, ordered=ordered)]
+
+    return asyncio.run(collect()), peak
+
+
+def test_ordered_results_follow_input_order():
+    results, peak = run_map([0.03, 0.01, 0.02, 0.0, 0.01], limit=3, ordered=True)
+
+    assert results == [0, 1, 2, 3, 4]
+    assert peak <= 3
+
+
+def test_unordered_results_follow_completion_order():
+    results, peak = run_map([0.05, 0.0, 0.02], limit=3, ordered=False)
+
+    assert results == [1, 2, 0]
+    assert peak == 3
+
+
+def test_limit_bounds_calls_in_flight():
+    _, peak = run_map([0.005] * 20, limit=4, ordered=False)
+
+    assert peak == 4
+
+
+def test_items_are_consumed_lazily():
+    consumed = []
+
+    def items():
+        for index in range(100):
+            consumed.append(index)
+            yield index
+
+    async def first_two():
+        results = bounded_map(asyncio.sleep, items(), limit=2, ordered=True)
+        collected = [await results.__anext__(), await results.__anext__()]
+        await results.aclose()
+        return collected
+
+    asyncio.run(first_two())
+
+    assert len(consumed) <= 4
+
+
+def test_errors_cancel_pending_calls():
+    cancelled = []
+
+    async def work(index: int):
+        if index == 0:
+            raise ValueError("boom")
+        try:
+            await asyncio.sleep(1)
+        except asyncio.CancelledError:
+            cancelled.append(index)
+            raise
+
+    async def collect():
+        return [r async for r in bounded_map(work, range(3), limit=3)]
+
+    with pytest.raises(ValueError):
+        asyncio.run(collect())
+    assert sorted(cancelled) == [1, 2]
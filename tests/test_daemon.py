@@ -0,0 +1,114 @@
+import asyncio
+import json
+
+from ollama_manager import daemon
+from ollama_manager.exceptions import OllamaConnectionError
+
+
+def test_job_store_dedupes_active_models(tmp_path):
+    store = daemon.JobStore(tmp_path / "queue.sqlite3")
+
+    job, created = store.add("llama3.2:latest")
+    same, created_again = store.add("llama3.2:latest")
+    assert created and not created_again
+    assert same.id == job.id
+
+    job.status = "done"
+    store.save(job)
+    _, created = store.add("llama3.2:latest")
+    assert created
+
+
+def test_job_store_requeues_interrupted_jobs(tmp_path):
+    store = daemon.JobStore(tmp_path / "queue.sqlite3")
+    job, _ = store.add("llama3.2:latest")
+    job.status = "running"
+    store.save(job)
+
+    store.requeue_running()
+
+    assert store.get(job.id).status == "queued"
+
+
+def run_daemon(
+    tmp_path, monkeypatch, pull, models: list[str], concurrency: int = 2
+) -> tuple[list[dict], list[daemon.Job]]:
+    monkeypatch.setattr(daemon.api, "pull", pull)
+
+    async def run():
+        store = daemon.JobStore(tmp_path / "queue.sqlite3")
+        pull_daemon = daemon.PullDaemon(store, concurrency=concurrency)
+        added = pull_daemon.add(models)
+        while pull_daemon.running:
+            await asyncio.sleep(0.01)
+        return added, store.recent()
+
+    return asyncio.run(run())
+
+
+def test_daemon_limits_concurrency_and_dedupes(tmp_path, monkeypatch):
+    running = peak = 0
+
+    async def pull(model, progress=None):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.02)
+        running -= 1
+
+    added, jobs = run_daemon(
+        tmp_path,
+        monkeypatch,
+        pull,
+        ["a", "b", "c", "a:latest", "hf.co/x/y"],
+        concurrency=2,
+    )
+
+    assert [job["model"] for job in added] == [
+        "a:latest",
+        "b:latest",
+        "c:latest",
+        "a:latest",
+        "hf.co/x/y:latest",
+    ]
+    assert added[3]["deduplicated"]
+    assert peak == 2
+    assert [job.status for job in jobs] == ["done"] * 4
+
+
+def test_daemon_fails_jobs_on_unexpected_errors(tmp_path, monkeypatch):
+    async def pull(model, progress=None):
+        if model == "broken:latest":
+            raise RuntimeError("stream dropped")
+        raise OllamaConnectionError("Ollama is down")
+
+    _, jobs = run_daemon(tmp_path, monkeypatch, pull, ["broken", "down"])
+    jobs = {job.model: job for job in jobs}
+
+    assert jobs["broken:latest"].status == "failed"
+    assert "stream dropped" in jobs["broken:latest"].error
+    assert jobs["down:latest"].status == "failed"
+    assert jobs["down:latest"].error == "Ollama is down"
+
+
+def test_daemon_idles_out_after_a_watcher_hangs_up(tmp_path):
+    path = tmp_path / "queue.sock"
+
+    async def run():
+        store = daemon.JobStore(tmp_path / "queue.sqlite3")
+        pull_daemon = daemon.PullDaemon(store, idle_timeout=0.1)
+        serving = asyncio.create_task(pull_daemon.serve(path))
+        while not path.exists():
+            await asyncio.sleep(0.01)
+
+        reader, writer = await asyncio.open_unix_connection(str(path))
+        writer.write(b'{"op": "watch"}\n')
+        assert json.loads(await reader.readline()) == {"jobs": []}
+        writer.close()
+        await writer.wait_closed()
+
+        await asyncio.wait_for(serving, timeout=5)
+        return pull_daemon.clients
+
+    assert asyncio.run(run()) == 0
+    assert not path.exists()
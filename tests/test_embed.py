@@ -0,0 +1,120 @@
+import array
+import asyncio
+import json
+
+import ollama
+import pytest
+from click.testing import CliRunner
+
+from ollama_manager.app import cli
+from ollama_manager.commands.embed import embed_batch
+from ollama_manager.embeddings import (
+    NPY_HEADER_SIZE,
+    Chunk,
+    NpyWriter,
+    chunk_text,
+    read_npy_shape,
+)
+from ollama_manager.exceptions import OllamaManagerError
+
+MODEL = "model-0000:latest"
+
+
+def read_rows(path, dim: int) -> list[list[float]]:
+    values = array.array("f", path.read_bytes()[NPY_HEADER_SIZE:])
+    return [values[i : i + dim].tolist() for i in range(0, len(values), dim)]
+
+
+def test_chunk_text_overlaps_and_breaks_on_whitespace():
+    text = "word " * 100
+
+    windows = list(chunk_text(text, size=50, overlap=10))
+
+    assert windows[0][0] == 0
+    assert windows[-1][1] == len(text)
+    for (_, end), (next_start, _) in zip(windows, windows[1:]):
+        assert end - next_start == 10
+    assert all(text[end - 1] == " " for _, end in windows)
+
+
+def test_chunk_text_skips_blank_windows():
+    assert list(chunk_text(" " * 30 + "text", size=10, overlap=0)) == [(30, 34)]
+
+
+def test_npy_writer_round_trip(tmp_path):
+    path, index_path = tmp_path / "e.npy", tmp_path / "e.ids.jsonl"
+
+    with NpyWriter(path, index_path) as writer:
+        writer.append([{"id": 0}, {"id": 1}], [[1.0, 2.0], [3.0, 4.0]])
+        writer.append([{"id": 2}], [[5.0, 6.0]])
+
+    assert read_npy_shape(path) == (3, 2)
+    assert read_rows(path, 2) == [[1.0, 2.0], [3.0, 4.0], [5.0, 6.0]]
+    assert len(index_path.read_text().splitlines()) == 3
+
+
+def test_npy_writer_resume_truncates_to_common_rows(tmp_path):
+    path, index_path = tmp_path / "e.npy", tmp_path / "e.ids.jsonl"
+    writer = NpyWriter(path, index_path)
+    writer.append([{"id": i} for i in range(3)], [[float(i)] * 4 for i in range(3)])
+    # Interrupted before the header was updated, mid-row and mid-line
+    writer._data.write(b"\0" * 6)
+    writer._data.flush()
+    writer._index.write(b'{"id": 3')
+    writer._index.flush()
+
+    resumed = NpyWriter.resume(path, index_path)
+    resumed.append([{"id": 3}], [[3.0] * 4])
+    resumed.close()
+
+    assert read_npy_shape(path) == (4, 4)
+    assert read_rows(path, 4) == [[float(i)] * 4 for i in range(4)]
+    ids = [json.loads(line) for line in index_path.read_text().splitlines()]
+    assert ids == [{"id": i} for i in range(4)]
+
+
+def test_embed_resumes_only_with_the_same_settings(ollama_server, tmp_path):
+    docs = tmp_path / "docs"
+    docs.mkdir()
+    for index in range(3):
+        (docs / f"doc{index}.md").write_text(f"document {index} " * 300)
+    output = tmp_path / "corpus"
+    runner = CliRunner()
+
+    def embed(*args):
+        return runner.invoke(
+            cli, ["embed", str(docs), "-o", str(output), "--chunk-size", "500", *args]
+        )
+
+    result = embed("-m", MODEL)
+    assert result.exit_code == 0, result.output
+    rows, dim = read_npy_shape(output.with_suffix(".npy"))
+    assert dim == ollama_server.embedding_size
+
+    index_path = output.with_suffix(".ids.jsonl")
+    lines = index_path.read_text().splitlines(keepends=True)
+    index_path.write_text("".join(lines[:5]))
+
+    result = embed("-m", "model-0001:latest")
+    assert result.exit_code == 1
+    assert "model 'model-0000:latest' -> 'model-0001:latest'" in result.output
+
+    result = embed("-m", MODEL, "--overlap", "0")
+    assert result.exit_code == 1
+    assert "overlap 200 -> 0" in result.output
+
+    result = embed("-m", MODEL)
+    assert result.exit_code == 0, result.output
+    assert "Resuming after 5 chunks" in result.output
+    assert read_npy_shape(output.with_suffix(".npy")) == (rows, dim)
+
+
+def test_embed_batch_rejects_a_short_response():
+    class ShortClient:
+        async def embed(self, model, input, truncate):
+            return ollama.EmbedResponse(embeddings=[[0.0]] * (len(input) - 1))
+
+    chunks = [Chunk("doc.md", start, start + 1, "x") for start in range(3)]
+
+    with pytest.raises(OllamaManagerError, match="got 2 embeddings for 3 chunks"):
+        asyncio.run(embed_batch(ShortClient(), MODEL, chunks))
@@ -0,0 +1,95 @@
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
+import pytest
+from click.testing import CliRunner
+
+from ollama_manager.app import cli
+from ollama_manager.utils import profiling
+
+
+@pytest.fixture(autouse=True)
+def tracer(monkeypatch):
+    """
+    Profiling is process-wide, restore it for the next test.
+    """
+    monkeypatch.setattr(profiling.tracer, "enabled", False)
+    monkeypatch.setattr(profiling.tracer, "spans", [])
+    return profiling.tracer
+
+
+def test_spans_are_only_recorded_when_enabled(tracer):
+    with profiling.span("ignored") as span:
+        assert span is None
+    assert tracer.spans == []
+
+    profiling.enable_profiling()
+    with profiling.span("parent") as parent:
+        with profiling.span("child", attempt=1) as child:
+            pass
+
+    assert [s.name for s in tracer.spans] == ["child", "parent"]
+    assert child.parent_id == parent.span_id and parent.parent_id is None
+    assert child.attributes == {"attempt": 1}
+    assert child.duration_ms <= parent.duration_ms
+
+
+def test_profile_prints_phase_breakdown(ollama_server):
+    result = CliRunner().invoke(cli, ["--profile", "list"])
+
+    assert result.exit_code == 0, result.output
+    assert "Profile" in result.output
+    assert "olm list" in result.output
+    assert "ollama.list" in result.output
+
+
+def test_trace_appends_spans_as_json_lines(ollama_server, tmp_path, monkeypatch):
+    trace_path = tmp_path / "spans.jsonl"
+    monkeypatch.setenv("OLM_TRACE", str(trace_path))
+
+    result = CliRunner().invoke(cli, ["list"])
+
+    assert result.exit_code == 0, result.output
+    spans = [json.loads(line) for line in trace_path.read_text().splitlines()]
+    root = next(s for s in spans if s["name"] == "olm list")
+    assert root["parent_id"] is None
+    assert all(s["trace_id"] == root["trace_id"] for s in spans)
+    assert any(s["name"] == "ollama.list" for s in spans)
+    assert all(s["duration_ms"] >= 0 for s in spans)
+
+
+def test_trace_exports_to_an_otlp_collector(tracer, monkeypatch):
+    received = []
+
+    class Collector(BaseHTTPRequestHandler):
+        def do_POST(self):
+            body = self.rfile.read(int(self.headers["Content-Length"]))
+            received.append((self.path, json.loads(body)))
+            self.send_response(200)
+            self.end_headers()
+
+        def log_message(self, *args):
+            pass
+
+    server = HTTPServer(("127.0.0.1", 0), Collector)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    monkeypatch.setenv("OLM_TRACE", f"http://127.0.0.1:{server.server_port}")
+
+    profiling.enable_profiling()
+    with profiling.span("olm list"):
+        with profiling.span("http.get", url="https://ollama.com", cached=False):
+            pass
+    profiling.export_spans()
+    server.shutdown()
+    server.server_close()
+
+    path, payload = received[0]
+    assert path == "/v1/traces"
+    spans = payload["resourceSpans"][0]["scopeSpans"][0]["spans"]
+    child, root = spans
+    assert child["parentSpanId"] == root["spanId"] and root["parentSpanId"] == ""
+    assert child["attributes"] == [
+        {"key": "url", "value": {"stringValue": "https://ollama.com"}},
+        {"key": "cached", "value": {"boolValue": False}},
+    ]
@@ -0,0 +1,44 @@
+from ollama_manager.ui.cache import cache_key
+from ollama_manager.ui.sessions import SessionStore
+
+
+def test_session_store_pages_messages(tmp_path):
+    store = SessionStore(tmp_path / "sessions.sqlite3")
+    session_id = store.create("text", "llama3.2:latest")
+    store.append(
+        session_id,
+        [{"role": "user", "content": f"message {index}"} for index in range(10)],
+    )
+
+    page = store.messages(session_id, offset=4, limit=3)
+
+    assert [message["content"] for message in page] == [
+        "message 4",
+        "message 5",
+        "message 6",
+    ]
+    assert store.get(session_id).title == "message 0"
+    assert store.get(session_id).message_count == 10
+
+
+def test_session_store_dedupes_images_and_returns_hashes(tmp_path):
+    store = SessionStore(tmp_path / "sessions.sqlite3")
+    image = tmp_path / "cat.png"
+    image.write_bytes(b"cat")
+    session_id = store.create("vision", "llava:latest")
+    messages = [
+        {"role": "user", "content": "what?", "images": [str(image)]},
+        {"role": "assistant", "content": "a cat", "cached": True},
+        {"role": "user", "content": "again?", "images": [b"cat"]},
+    ]
+    store.append(session_id, messages)
+
+    loaded = store.messages(session_id)
+
+    assert loaded[0]["images"] == [b"cat"] and loaded[2]["images"] == [b"cat"]
+    assert loaded[0]["image_hashes"] == loaded[2]["image_hashes"]
+    assert loaded[1]["cached"]
+    assert cache_key("d", None, loaded) == cache_key("d", None, messages)
+
+    store.delete(session_id)
+    assert store._db.execute("SELECT COUNT(*) FROM images").fetchone() == (0,)
@@ -0,0 +1,135 @@
+import asyncio
+import hashlib
+
+import httpx
+import pytest
+from click.testing import CliRunner
+
+from ollama_manager import api
+from ollama_manager.app import cli
+from ollama_manager.exceptions import OllamaManagerError
+from ollama_manager.registry import ManifestCache, fetch_manifest_digest, manifest_url
+
+
+def local_digest(name: str) -> str:
+    # The digest the fake Ollama daemon reports for a model
+    return hashlib.sha256(name.encode()).hexdigest()
+
+
+@pytest.mark.parametrize(
+    ("model", "expected"),
+    [
+        ("llama3.2", "https://registry.ollama.ai/v2/library/llama3.2/manifests/latest"),
+        ("llama3.2:1b", "https://registry.ollama.ai/v2/library/llama3.2/manifests/1b"),
+        ("user/model:q4", "https://registry.ollama.ai/v2/user/model/manifests/q4"),
+        (
+            "hf.co/bartowski/Llama-3.2-1B-Instruct-GGUF:Q4_K_M",
+            "https://hf.co/v2/bartowski/Llama-3.2-1B-Instruct-GGUF/manifests/Q4_K_M",
+        ),
+        (
+            "localhost:5000/model",
+            "https://localhost:5000/v2/library/model/manifests/latest",
+        ),
+    ],
+)
+def test_manifest_url(model, expected):
+    assert manifest_url(model) == expected
+
+
+def test_fetch_manifest_digest_revalidates_with_etag(tmp_path):
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        if request.headers.get("If-None-Match") == '"v1"':
+            return httpx.Response(304)
+        return httpx.Response(
+            200,
+            headers={"ETag": '"v1"', "Docker-Content-Digest": "sha256:abc"},
+            content=b"{}",
+        )
+
+    async def fetch_twice(cache: ManifestCache) -> list[str]:
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            return [
+                await fetch_manifest_digest(client, "llama3.2", cache),
+                await fetch_manifest_digest(client, "llama3.2", cache),
+            ]
+
+    cache = ManifestCache(tmp_path / "manifests.json")
+    assert asyncio.run(fetch_twice(cache)) == ["abc", "abc"]
+    assert "If-None-Match" not in requests[0].headers
+    assert requests[1].headers["If-None-Match"] == '"v1"'
+
+    # The ETag survives a restart
+    cache.save()
+    requests.clear()
+    asyncio.run(fetch_twice(ManifestCache(tmp_path / "manifests.json")))
+    assert all(request.headers["If-None-Match"] == '"v1"' for request in requests)
+
+
+def test_fetch_manifest_digest_hashes_the_manifest_without_a_digest_header():
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, content=b'{"layers": []}')
+
+    async def fetch() -> str:
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            return await fetch_manifest_digest(client, "llama3.2")
+
+    assert asyncio.run(fetch()) == hashlib.sha256(b'{"layers": []}').hexdigest()
+
+
+def registry_client() -> httpx.AsyncClient:
+    """
+    Serves manifests that match the fake daemon for `model-0000`, differ for
+    `model-0001` and are missing for everything else.
+    """
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        name = request.url.path.split("/")[3]
+        if name == "model-0000":
+            digest = local_digest("model-0000:latest")
+        elif name == "model-0001":
+            digest = "0" * 64
+        else:
+            return httpx.Response(404)
+        return httpx.Response(
+            200, headers={"Docker-Content-Digest": f"sha256:{digest}"}
+        )
+
+    return httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+
+def check_updates(tmp_path, models: list[str]) -> dict[str, api.ModelUpdate]:
+    async def check():
+        async with registry_client() as client:
+            return await api.check_updates(
+                models, client=client, cache=ManifestCache(tmp_path / "manifests.json")
+            )
+
+    return {update.name: update for update in asyncio.run(check())}
+
+
+def test_check_updates_matches_untagged_names(ollama_server, tmp_path):
+    updates = check_updates(tmp_path, ["model-0000", "model-0001", "model-0002:latest"])
+
+    assert list(updates) == [
+        "model-0000:latest",
+        "model-0001:latest",
+        "model-0002:latest",
+    ]
+    assert not updates["model-0000:latest"].outdated
+    assert updates["model-0001:latest"].outdated
+    assert updates["model-0002:latest"].error
+
+
+def test_check_updates_rejects_models_that_are_not_installed(ollama_server, tmp_path):
+    with pytest.raises(OllamaManagerError, match="not installed: missing:latest"):
+        check_updates(tmp_path, ["model-0000", "missing"])
+
+
+def test_outdated_reports_models_that_are_not_installed(ollama_server):
+    result = CliRunner().invoke(cli, ["outdated", "missing"])
+
+    assert result.exit_code == 1
+    assert "Model not installed: missing:latest" in result.output